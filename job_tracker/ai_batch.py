@@ -0,0 +1,276 @@
+"""
+AI Batch Module - Gemini Batch API integration for bulk workloads
+Submits many independent prompts as one JSONL job (bulk CV intake, bulk JD matching).
+Interactive UI calls keep using the synchronous functions in ai_service.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Dict, Any, List, Optional, Union, get_args, get_origin, get_type_hints
+
+from ai_service import (
+    GEMINI_API_KEY,
+    GENAI_CLIENT_AVAILABLE,
+    _MODEL_MAP,
+    _get_client,
+    _build_prompt_deep_cv,
+    _parse_deep_cv_response,
+    _get_empty_profile_structure,
+    _build_prompt_match,
+    _parse_match_response,
+)
+
+logger = logging.getLogger('jta.ai.batch')
+
+BATCH_POLL_INTERVAL = 30  # seconds
+
+# Feature names returned by the _build_prompt_* helpers -> _MODEL_MAP keys, so a
+# batch runs on the same model as the interactive call for that feature
+_FEATURE_MODEL_KEYS = {
+    'DEEP_CV_EXTRACTION': 'DEEP_CV',
+    'JD_CV_MATCHING': 'JD_CV_MATCHING',
+}
+
+# Terminal states reported by batches.get()
+BATCH_COMPLETED_STATES = {
+    'JOB_STATE_SUCCEEDED',
+    'JOB_STATE_FAILED',
+    'JOB_STATE_CANCELLED',
+    'JOB_STATE_EXPIRED',
+}
+
+
+def is_batch_available() -> bool:
+    """Check if the Batch API client can be used."""
+    return GENAI_CLIENT_AVAILABLE and bool(GEMINI_API_KEY)
+
+
+def _schema_to_json(schema: Any) -> Dict[str, Any]:
+    """Convert a TypedDict response schema into the JSON form used in batch requests."""
+    nullable = False
+    if get_origin(schema) is Union:
+        options = get_args(schema)
+        nullable = type(None) in options
+        schema = next(option for option in options if option is not type(None))
+
+    if get_origin(schema) in (list, List):
+        result = {"type": "ARRAY", "items": _schema_to_json(get_args(schema)[0])}
+    elif isinstance(schema, type) and issubclass(schema, dict):
+        properties = {key: _schema_to_json(field) for key, field in get_type_hints(schema).items()}
+        result = {"type": "OBJECT", "properties": properties, "required": list(properties)}
+    elif schema is int:
+        result = {"type": "INTEGER"}
+    elif schema is float:
+        result = {"type": "NUMBER"}
+    elif schema is bool:
+        result = {"type": "BOOLEAN"}
+    else:
+        result = {"type": "STRING"}
+
+    if nullable:
+        result["nullable"] = True
+    return result
+
+
+def _serialize_generation_config(generation_config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Make a generation config JSON-serializable for the JSONL request file."""
+    config = dict(generation_config or {})
+    if "response_schema" in config:
+        config["response_schema"] = _schema_to_json(config["response_schema"])
+    return config
+
+
+def _model_for_feature(feature: str) -> str:
+    """Model the interactive path uses for this feature (honours AI_MODEL_* overrides)."""
+    return _MODEL_MAP[_FEATURE_MODEL_KEYS.get(feature, feature)]
+
+
+def _batch_state(batch_job) -> str:
+    """Return the batch job state as a plain string."""
+    state = getattr(batch_job, 'state', None)
+    return getattr(state, 'name', None) or str(state)
+
+
+def submit_batch(jobs: List[Dict[str, Any]], model: str) -> str:
+    """
+    Submit prompts to the Gemini Batch API as a single JSONL job.
+
+    Args:
+        jobs: List of dicts with 'key', 'prompt' and 'generation_config'
+        model: Model every request in the batch runs on
+
+    Returns:
+        Batch job name, used to poll for status and fetch results
+    """
+    if not is_batch_available():
+        raise RuntimeError("Batch API not available. Install google-genai and configure GEMINI_API_KEY.")
+    if not jobs:
+        raise ValueError("No jobs to submit")
+
+    client = _get_client()
+
+    with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False, encoding='utf-8') as f:
+        for job in jobs:
+            generation_config = _serialize_generation_config(job.get('generation_config'))
+            request = {"contents": [{"parts": [{"text": job['prompt']}]}]}
+            system_instruction = generation_config.pop("system_instruction", None)
+            if system_instruction:
+                request["system_instruction"] = {"parts": [{"text": system_instruction}]}
+            request["generation_config"] = generation_config
+            line = {"key": str(job['key']), "request": request}
+            f.write(json.dumps(line) + "\n")
+        jsonl_path = f.name
+
+    try:
+        uploaded = client.files.upload(
+            file=jsonl_path,
+            config={'display_name': os.path.basename(jsonl_path), 'mime_type': 'jsonl'}
+        )
+    finally:
+        os.remove(jsonl_path)
+
+    batch_job = client.batches.create(
+        model=model,
+        src=uploaded.name,
+        config={'display_name': f"jta-batch-{int(time.time())}"}
+    )
+    logger.info("Submitted batch job %s with %d requests", batch_job.name, len(jobs))
+    return batch_job.name
+
+
+def get_batch_state(batch_name: str) -> str:
+    """Return the current state of a batch job (e.g. JOB_STATE_RUNNING)."""
+    return _batch_state(_get_client().batches.get(name=batch_name))
+
+
+def wait_for_batch(batch_name: str, poll_interval: int = BATCH_POLL_INTERVAL, timeout: Optional[int] = None):
+    """
+    Poll a batch job until it reaches a terminal state.
+    Returns the final batch job object.
+    """
+    client = _get_client()
+    started = time.time()
+    while True:
+        batch_job = client.batches.get(name=batch_name)
+        state = _batch_state(batch_job)
+        if state in BATCH_COMPLETED_STATES:
+            logger.info("Batch job %s finished with state %s", batch_name, state)
+            return batch_job
+        if timeout is not None and time.time() - started > timeout:
+            raise TimeoutError(f"Batch job {batch_name} still {state} after {timeout}s")
+        time.sleep(poll_interval)
+
+
+def fetch_batch_results(batch_job) -> Dict[str, Optional[str]]:
+    """
+    Download the results file of a finished batch job.
+
+    Returns:
+        Dictionary mapping each request key to its response text (None if the request failed)
+    """
+    state = _batch_state(batch_job)
+    if state != 'JOB_STATE_SUCCEEDED':
+        raise RuntimeError(f"Batch job {batch_job.name} did not succeed: {state}")
+
+    dest = getattr(batch_job, 'dest', None)
+    if not dest or not getattr(dest, 'file_name', None):
+        raise RuntimeError(f"Batch job {batch_job.name} has no result file")
+
+    content = _get_client().files.download(file=dest.file_name)
+    if isinstance(content, bytes):
+        content = content.decode('utf-8')
+
+    results = {}
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        key = entry.get('key')
+        text = None
+        try:
+            parts = entry['response']['candidates'][0]['content']['parts']
+            text = ''.join(part.get('text', '') for part in parts)
+        except (KeyError, IndexError, TypeError):
+            logger.warning("Batch result for key %s has no text: %s", key, entry.get('error'))
+        results[key] = text
+    return results
+
+
+def submit_cv_extraction_batch(cv_texts: Dict[str, str]) -> str:
+    """
+    Queue deep CV extraction for many CVs at once (bulk CV intake).
+
+    Args:
+        cv_texts: Dictionary mapping a caller-chosen key (e.g. user id) to CV text
+
+    Returns:
+        Batch job name
+    """
+    jobs = []
+    feature = None
+    for key, cv_text in cv_texts.items():
+        feature, prompt, generation_config = _build_prompt_deep_cv(cv_text)
+        jobs.append({"key": key, "prompt": prompt, "generation_config": generation_config})
+    if not jobs:
+        raise ValueError("No jobs to submit")
+    return submit_batch(jobs, _model_for_feature(feature))
+
+
+def collect_cv_extraction_batch(batch_name: str, poll_interval: int = BATCH_POLL_INTERVAL) -> Dict[str, Dict[str, Any]]:
+    """
+    Wait for a CV extraction batch and parse each result into the profile structure.
+    Failed or unparseable entries map to the empty profile structure.
+    """
+    results = fetch_batch_results(wait_for_batch(batch_name, poll_interval))
+    profiles = {}
+    for key, text in results.items():
+        try:
+            profiles[key] = _parse_deep_cv_response(text) if text else _get_empty_profile_structure()
+        except Exception as e:
+            logger.error("Batch CV extraction failed for %s: %s", key, e)
+            profiles[key] = _get_empty_profile_structure()
+    return profiles
+
+
+def submit_match_batch(job_descriptions: Dict[str, str], about_me: Dict[str, Any]) -> str:
+    """
+    Queue JD-CV matching of one profile against many job descriptions.
+
+    Args:
+        job_descriptions: Dictionary mapping a caller-chosen key (e.g. job id) to JD text
+        about_me: Structured profile data from database
+
+    Returns:
+        Batch job name
+    """
+    jobs = []
+    feature = None
+    for key, job_description in job_descriptions.items():
+        feature, prompt, generation_config = _build_prompt_match(job_description, about_me)
+        jobs.append({"key": key, "prompt": prompt, "generation_config": generation_config})
+    if not jobs:
+        raise ValueError("No jobs to submit")
+    return submit_batch(jobs, _model_for_feature(feature))
+
+
+def collect_match_batch(batch_name: str, poll_interval: int = BATCH_POLL_INTERVAL) -> Dict[str, Dict[str, Any]]:
+    """Wait for a JD-CV matching batch and parse each result."""
+    results = fetch_batch_results(wait_for_batch(batch_name, poll_interval))
+    matches = {}
+    for key, text in results.items():
+        try:
+            if not text:
+                raise ValueError("Empty batch response")
+            matches[key] = _parse_match_response(text)
+        except Exception as e:
+            logger.error("Batch JD-CV matching failed for %s: %s", key, e)
+            matches[key] = {
+                "match_score": 0,
+                "matched_skills": [],
+                "missing_skills": [],
+                "summary": f"Error analyzing match: {str(e)}"
+            }
+    return matches
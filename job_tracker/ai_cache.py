@@ -0,0 +1,139 @@
+"""
+AI Cache Module - Content-addressed cache for Gemini responses
+Stores raw response text in a local SQLite file keyed by a hash of everything
+that determines the output (model, prompt version, generation settings, prompt).
+Recently used entries are also kept in memory so repeat hits skip SQLite.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger('jta.ai.cache')
+
+AI_CACHE_PATH = os.environ.get(
+    'AI_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ai_cache.db')
+)
+
+# Entries older than this are treated as misses (both tiers)
+AI_CACHE_TTL = int(os.environ.get('AI_CACHE_TTL', 24 * 3600))  # seconds
+MEMORY_CACHE_SIZE = 256
+
+# key -> (value, created_at), least recently used first
+_memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS ai_cache (
+    cache_key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+_table_ready = False
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating the table on first use."""
+    global _table_ready
+    conn = sqlite3.connect(AI_CACHE_PATH, timeout=5)
+    if not _table_ready:
+        conn.execute(_CREATE_TABLE_SQL)
+        conn.commit()
+        _table_ready = True
+    return conn
+
+
+def make_cache_key(*fields: Any) -> str:
+    """
+    Build a sha256 cache key from the given fields.
+    Each field is prefixed with its 8-byte length so that different field
+    splits of the same bytes can never collide.
+    """
+    digest = hashlib.sha256()
+    for field in fields:
+        data = ('' if field is None else str(field)).encode('utf-8')
+        digest.update(struct.pack('>Q', len(data)))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _memory_put(key: str, value: str, created_at: float) -> None:
+    with _memory_lock:
+        _memory[key] = (value, created_at)
+        _memory.move_to_end(key)
+        if len(_memory) > MEMORY_CACHE_SIZE:
+            _memory.popitem(last=False)
+
+
+def cache_get(key: str) -> Optional[str]:
+    """Return the cached value for key, or None on a miss, expired entry or cache error."""
+    expired_before = time.time() - AI_CACHE_TTL
+    with _memory_lock:
+        entry = _memory.get(key)
+        if entry is not None:
+            if entry[1] >= expired_before:
+                _memory.move_to_end(key)
+                return entry[0]
+            del _memory[key]
+    
+    conn = None
+    try:
+        conn = _connect()
+        row = conn.execute(
+            "SELECT value, created_at FROM ai_cache WHERE cache_key = ? AND created_at >= ?",
+            (key, expired_before)
+        ).fetchone()
+        if row is None:
+            return None
+        _memory_put(key, row[0], row[1])
+        return row[0]
+    except sqlite3.Error as e:
+        logger.warning("AI cache read failed: %s", e)
+        return None
+    finally:
+        if conn:
+            conn.close()
+
+
+def cache_put(key: str, value: str) -> None:
+    """Store value under key, replacing any existing entry."""
+    created_at = time.time()
+    _memory_put(key, value, created_at)
+    conn = None
+    try:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO ai_cache (cache_key, value, created_at) VALUES (?, ?, ?)",
+            (key, value, created_at)
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.warning("AI cache write failed: %s", e)
+    finally:
+        if conn:
+            conn.close()
+
+
+def cache_delete(key: str) -> None:
+    """Evict a single entry."""
+    with _memory_lock:
+        _memory.pop(key, None)
+    conn = None
+    try:
+        conn = _connect()
+        conn.execute("DELETE FROM ai_cache WHERE cache_key = ?", (key,))
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.warning("AI cache delete failed: %s", e)
+    finally:
+        if conn:
+            conn.close()
@@ -3,51 +3,741 @@ AI Service Module - Centralized Google Gemini API Integration
 Handles all AI-powered features: CV extraction, cover letters, emails, matching
 """
 
+import asyncio
+import copy
+import atexit
+import importlib.util
+import io
 import json
+import logging
 import os
+import queue
 import re
-from typing import Dict, Any, Optional
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, TypedDict, Union, get_args, get_origin, get_type_hints
+
+from ai_cache import make_cache_key, cache_get, cache_put, cache_delete
+
+# Load environment variables from .env file, unless the key is already set
+# (app.py and process managers load it before this module is imported)
+if not os.environ.get('GEMINI_API_KEY'):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        # python-dotenv not installed, continue without it
+        pass
+
+
+def _module_available(name: str) -> bool:
+    """Check whether a module can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
 
-# Load environment variables from .env file if it exists
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    # python-dotenv not installed, continue without it
-    pass
 
-# Google Gemini API imports
+# Google Gemini SDKs are heavy (gRPC, protobuf), so they are only imported on
+# first use; see _genai() and _get_client().
+GEMINI_AVAILABLE = _module_available('google.generativeai')
+# Google GenAI SDK (needed for service tier selection)
+GENAI_CLIENT_AVAILABLE = _module_available('google.genai')
+
+# Fast JSON parsing/encoding (optional). orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so handlers work with either loader.
 try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    GEMINI_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
 
 # Configuration
 GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY', '')
-GEMINI_CONFIGURED = False
+GEMINI_CONFIGURED = bool(GEMINI_API_KEY)
 
-if GEMINI_AVAILABLE and GEMINI_API_KEY:
-    try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        GEMINI_CONFIGURED = True
-    except Exception:
-        GEMINI_CONFIGURED = False
+_genai_module = None
+_genai_lock = threading.Lock()
+
+
+def _genai():
+    """Import and configure google.generativeai on first use."""
+    global _genai_module
+    if _genai_module is None:
+        with _genai_lock:
+            if _genai_module is None:
+                import google.generativeai as genai
+                genai.configure(api_key=GEMINI_API_KEY)
+                _genai_module = genai
+    return _genai_module
+
+
+# Neither flag changes after import, so the public functions check this constant
+_AI_READY = GEMINI_AVAILABLE and GEMINI_CONFIGURED
+
+# Logging goes through a queue so worker threads never block on stdout;
+# a background listener does the actual writing.
+logger = logging.getLogger('jta.ai')
+logger.setLevel(os.environ.get('AI_LOG_LEVEL', 'INFO').upper())
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Per-call trace records (JSON lines) kept in memory for the debug endpoint.
+# deque.append is atomic, so recording needs no lock.
+AI_TRACE_MAXLEN = 10000
+_ai_trace = deque(maxlen=AI_TRACE_MAXLEN)
+
+# Models per workload: flash-lite for structured extraction/analysis,
+# flash for free-form writing.
+MODEL_EXTRACTION = 'gemini-2.5-flash-lite'
+MODEL_GENERATIVE = 'gemini-2.5-flash'
+
+# Model per feature. Short structured JSON (CV sections, email, scoring) runs on
+# the extraction model; the cover letter keeps the writing model. Each entry can
+# be overridden with AI_MODEL_<FEATURE>, e.g. AI_MODEL_JD_CV_MATCHING.
+_MODEL_MAP = {
+    feature: os.environ.get(f'AI_MODEL_{feature}', default)
+    for feature, default in {
+        'DEEP_CV': MODEL_EXTRACTION,
+        'COVER_LETTER': MODEL_GENERATIVE,
+        'APPLICATION_EMAIL': MODEL_EXTRACTION,
+        'JD_CV_MATCHING': MODEL_EXTRACTION,
+    }.items()
+}
+
+# Markdown code fences around a whole response (not fences inside it)
+_FENCE_RE = re.compile(r'\A```(?:json|text)?\s*|\s*```\Z')
+
+# Input budgets in tokens. Text under the budget in characters is always under it
+# in tokens, so count_tokens is only called for longer inputs.
+CV_TOKEN_BUDGET = 6000
+JD_TOKEN_BUDGET = 1500
+
+# CV section headings, used to send each per-section call only the part of a long CV it needs
+_CV_SECTION_HEADERS = {
+    "summary": r'(?:professional\s+)?summary|profile|objective|about\s+me',
+    "experience": r'(?:work\s+|professional\s+)?experience|employment(?:\s+history)?|work\s+history',
+    "education": r'education|academic\s+background|qualifications',
+    "skills": r'(?:technical\s+|key\s+)?skills|technologies|tech\s+stack',
+    "projects": r'(?:personal\s+|academic\s+)?projects',
+    "achievements": r'achievements|certifications?|awards|honou?rs',
+}
+_CV_SECTION_HEADER_RE = re.compile(
+    r'^[ \t]*(?:' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in _CV_SECTION_HEADERS.items()) + r')[ \t]*:?[ \t]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Identity fields that can be read from the CV without the model
+_EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,}')
+_PHONE_RE = re.compile(r'(?<![\w/])\+?\(?\d[\d\s().-]{7,}\d(?![\w/])')
+_LINKEDIN_RE = re.compile(r'(?:https?://)?(?:[\w-]+\.)?linkedin\.com/[^\s,;|)>\]]+', re.IGNORECASE)
+_GITHUB_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/[^\s,;|)>\]]+', re.IGNORECASE)
+_URL_RE = re.compile(r'(?:https?://|www\.)[^\s,;|)>\]]+', re.IGNORECASE)
+_LOCATION_RE = re.compile(r'^[ \t]*(?:location|address|based in)[ \t]*[:\-][ \t]*(.+?)[ \t]*$', re.IGNORECASE | re.MULTILINE)
+_NAME_LINE_RE = re.compile(r"^[A-Z][A-Za-z'.-]*(?:[ \t]+[A-Z][A-Za-z'.-]*){1,3}$")
+
+# CVs shorter than this (in characters) that contain nothing but contact
+# details are answered from the regex identity pass without calling the model
+SHORT_CV_CHARS = 500
+# Words a contact line may have besides its values (labels like "Email:", "Mobile")
+_CONTACT_LABEL_WORDS = 3
+_WORD_RE = re.compile(r'\w+')
+
+# Bump when prompt wording changes so cached responses from older prompts are not reused
+PROMPT_VERSION = "3"
+
+# How many times a response that fails schema validation is sent back to the
+# model with the error appended before giving up
+MAX_VALIDATION_RETRIES = 2
+
+# Jobs scored per multi-JD matching prompt, and output tokens allowed per job
+MULTI_MATCH_CHUNK_SIZE = 10
+MULTI_MATCH_TOKENS_PER_JOB = 350
+
+# Service tiers. Flex is cheaper but latency-tolerant; None uses the standard tier.
+SERVICE_TIER_FLEX = 'flex'
+SERVICE_TIER_STANDARD = None
+
+
+
+# Response schemas for structured (JSON mode) output. Mirrors _get_empty_profile_structure().
+class IdentitySchema(TypedDict):
+    name: Optional[str]
+    email: Optional[str]
+    phone: Optional[str]
+    location: Optional[str]
+    links: Optional[List[str]]
+
+
+class SkillsSchema(TypedDict):
+    technical: Optional[List[str]]
+    tools: Optional[List[str]]
+    soft: Optional[List[str]]
+
+
+class ExperienceSchema(TypedDict):
+    company: Optional[str]
+    role: Optional[str]
+    duration: Optional[str]
+    responsibilities: Optional[List[str]]
+
+
+class EducationSchema(TypedDict):
+    degree: Optional[str]
+    institution: Optional[str]
+    year: Optional[str]
+    specialization: Optional[str]
+
+
+class ProjectSchema(TypedDict):
+    name: Optional[str]
+    tech_stack: Optional[str]
+    impact: Optional[str]
+
+
+class ProfileSchema(TypedDict):
+    identity: IdentitySchema
+    professional_summary: Optional[str]
+    skills: SkillsSchema
+    experience: Optional[List[ExperienceSchema]]
+    education: Optional[List[EducationSchema]]
+    projects: Optional[List[ProjectSchema]]
+    achievements: Optional[List[str]]
+
+
+# Per-section schemas for the parallel CV extraction calls
+class IdentitySectionSchema(TypedDict):
+    identity: IdentitySchema
+
+
+class SummarySectionSchema(TypedDict):
+    professional_summary: Optional[str]
+
+
+class SkillsSectionSchema(TypedDict):
+    skills: SkillsSchema
+
+
+class ExperiencePointerSchema(TypedDict):
+    company: Optional[str]
+    role: Optional[str]
+    duration: Optional[str]
+    responsibility_lines: Optional[List[List[int]]]
+
+
+class ExperienceEducationSectionSchema(TypedDict):
+    experience: Optional[List[ExperiencePointerSchema]]
+    education: Optional[List[EducationSchema]]
+
+
+class ProjectsAchievementsSectionSchema(TypedDict):
+    projects: Optional[List[ProjectSchema]]
+    achievements: Optional[List[str]]
+
+
+class MatchSchema(TypedDict):
+    match_score: int
+    matched_skills: List[str]
+    missing_skills: List[str]
+    summary: str
+
+
+class IndexedMatchSchema(MatchSchema):
+    job_index: int
+
+
+class EmailSchema(TypedDict):
+    subject: str
+    body: str
+
+
+def _json_generation_config(generation_config: Dict[str, Any], schema: type) -> Dict[str, Any]:
+    """Add JSON mode and a response schema to a generation config."""
+    return {
+        **generation_config,
+        "response_mime_type": "application/json",
+        "response_schema": schema,
+    }
+
+
+def _array_generation_config(generation_config: Dict[str, Any], item_schema: Any, count: int, tokens_per_item: int) -> Dict[str, Any]:
+    """Turn a per-item generation config into one returning a JSON array of count items."""
+    base = {k: v for k, v in generation_config.items() if k not in ("response_mime_type", "response_schema")}
+    base["max_output_tokens"] = tokens_per_item * count
+    return _json_generation_config(base, List[item_schema])
+
+
+# System instructions. Sent once per model as system_instruction instead of being
+# repeated in every prompt; the JSON shape itself comes from the response schemas.
+SYSTEM_INSTRUCTION = """You are a precise assistant for a job application tracker.
+Respond with JSON that matches the requested schema. No markdown, no code blocks, no explanations."""
+
+CV_SYSTEM_INSTRUCTION = SYSTEM_INSTRUCTION + """
+You extract professional information from CV/resume text for a recruiter-facing "About Me" profile.
+- Only include data actually present in the CV; never invent or guess values
+- Use null for anything not found (not empty strings or empty arrays)
+- No filler text; keep wording professional and recruiter-friendly"""
+
+MATCH_SYSTEM_INSTRUCTION = SYSTEM_INSTRUCTION + """
+You compare job descriptions with candidate profiles. Be honest and accurate; do not inflate scores."""
+
+EMAIL_SYSTEM_INSTRUCTION = SYSTEM_INSTRUCTION + """
+You write concise, professional job application emails: no emojis, no excessive formality,
+approachable tone, clear call-to-action."""
+
+COVER_LETTER_SYSTEM_INSTRUCTION = """You write professional cover letters for job applications.
+Tone: confident but not arrogant, human and authentic, professional and recruiter-friendly.
+Avoid buzzwords, exaggeration and cliches like "I'm a team player" or "I'm passionate".
+Return ONLY the cover letter text: no explanations, no markdown formatting."""
+
+# Generation settings per feature. Kept as plain dicts so the same values can be
+# used for synchronous calls and serialized into Batch API requests (see ai_batch.py).
+DEEP_CV_GENERATION_CONFIG = _json_generation_config({
+    "temperature": 0.1,  # Low temperature for deterministic extraction
+    "max_output_tokens": 2000,
+    "system_instruction": CV_SYSTEM_INSTRUCTION,
+}, ProfileSchema)
+# Per-section CV extraction calls return small JSON objects; the schema is added per section
+CV_SECTION_GENERATION_CONFIG = {
+    "temperature": 0.1,
+    "max_output_tokens": 800,
+    "system_instruction": CV_SYSTEM_INSTRUCTION,
+}
+COVER_LETTER_GENERATION_CONFIG = {
+    "temperature": 0.7,  # Slightly higher for creative writing
+    "max_output_tokens": 500,
+    "system_instruction": COVER_LETTER_SYSTEM_INSTRUCTION,
+}
+APPLICATION_EMAIL_GENERATION_CONFIG = _json_generation_config({
+    "temperature": 0.6,
+    "max_output_tokens": 300,
+    "system_instruction": EMAIL_SYSTEM_INSTRUCTION,
+}, EmailSchema)
+JD_CV_MATCHING_GENERATION_CONFIG = _json_generation_config({
+    "temperature": 0.2,  # Low temperature for analytical task
+    "max_output_tokens": 350,
+    "system_instruction": MATCH_SYSTEM_INSTRUCTION,
+}, MatchSchema)
 
 
 def is_ai_available() -> bool:
     """Check if Gemini AI is available and configured."""
-    return GEMINI_AVAILABLE and GEMINI_CONFIGURED
+    return _AI_READY
+
+
+_client = None
+
+
+def _get_client():
+    """Create the GenAI client on first use."""
+    global _client
+    if _client is None:
+        from google import genai as genai_client
+        _client = genai_client.Client(api_key=GEMINI_API_KEY)
+    return _client
+
+
+_models: Dict[Tuple[str, Optional[str]], Any] = {}
+_models_lock = threading.Lock()
+
+
+def _get_model(model_name: str, system_instruction: Optional[str] = None):
+    """
+    Return a shared GenerativeModel per (model, system instruction).
+    One entry per feature: CV, matching, email, cover letter and token counting.
+    Created under a lock so concurrent first calls build a single instance.
+    """
+    key = (model_name, system_instruction)
+    model = _models.get(key)
+    if model is None:
+        with _models_lock:
+            model = _models.get(key)
+            if model is None:
+                model = _genai().GenerativeModel(model_name, system_instruction=system_instruction)
+                _models[key] = model
+    return model
+
+
+def _strip_fences(text: str) -> str:
+    """Remove markdown code fences (```json / ```text) around a response."""
+    return _FENCE_RE.sub('', text.strip()).strip()
+
+
+def _count_tokens(text: str, model_name: str = MODEL_EXTRACTION) -> int:
+    """
+    Count tokens with the Gemini tokenizer, cached by content.
+    Falls back to a ~4 chars/token estimate if counting fails.
+    """
+    cache_key = make_cache_key("count_tokens", model_name, text)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return int(cached)
+    
+    try:
+        total_tokens = _get_model(model_name).count_tokens(text).total_tokens
+    except Exception as e:
+        logger.warning("count_tokens failed, estimating: %s", e)
+        return len(text) // 4 + 1
+    
+    cache_put(cache_key, str(total_tokens))
+    return total_tokens
+
+
+def _truncate_to_tokens(text: str, token_budget: int, model_name: str = MODEL_EXTRACTION) -> str:
+    """Truncate text to roughly token_budget tokens, cutting at a line or word boundary."""
+    if len(text) <= token_budget:
+        return text
+    
+    total_tokens = _count_tokens(text, model_name)
+    if total_tokens <= token_budget:
+        return text
+    
+    # Cut proportionally (with a little headroom), then back off to a clean boundary
+    cut = int(len(text) * token_budget / total_tokens * 0.95)
+    boundary = text.rfind("\n", 0, cut)
+    if boundary < cut // 2:
+        boundary = text.rfind(" ", 0, cut)
+    if boundary < cut // 2:
+        boundary = cut
+    logger.info("Truncated input from %d tokens to ~%d (%d of %d chars)", total_tokens, token_budget, boundary, len(text))
+    return text[:boundary]
+
+
+def _split_cv_sections(cv_text: str) -> Dict[str, str]:
+    """
+    Split CV text on recognised section headings.
+    Text before the first heading is returned under "header"; repeated
+    headings are concatenated.
+    """
+    sections = {}
+    matches = list(_CV_SECTION_HEADER_RE.finditer(cv_text))
+    sections["header"] = cv_text[:matches[0].start()] if matches else cv_text
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(cv_text)
+        name = match.lastgroup
+        sections[name] = sections.get(name, "") + cv_text[match.start():end]
+    return sections
+
+
+def _cv_section_inputs(cv_text: str) -> Dict[str, str]:
+    """
+    Pick the CV text each per-section extractor receives.
+    CVs within CV_TOKEN_BUDGET are sent whole; longer ones are split on
+    section headings so each call only sees the sections it extracts.
+    """
+    extractor_names = ["identity", "summary", "skills", "experience_education", "projects_achievements"]
+    truncated = _truncate_to_tokens(cv_text, CV_TOKEN_BUDGET)
+    if truncated is cv_text:
+        return {name: cv_text for name in extractor_names}
+    
+    sections = _split_cv_sections(cv_text)
+    
+    def pick(*names: str) -> str:
+        text = "".join(sections.get(name, "") for name in names)
+        return _truncate_to_tokens(text, CV_TOKEN_BUDGET) if text.strip() else truncated
+    
+    return {
+        "identity": pick("header"),
+        "summary": pick("header", "summary", "experience"),
+        "skills": pick("skills"),
+        "experience_education": pick("experience", "education"),
+        "projects_achievements": pick("projects", "achievements"),
+    }
+
+
+def _check_schema(value: Any, schema: Any, path: str = "$") -> None:
+    """
+    Check parsed JSON against a response schema (TypedDict / typing hints).
+    Raises ValueError naming the first offending field.
+    """
+    origin = get_origin(schema)
+    if origin is Union:
+        options = get_args(schema)
+        if value is None and type(None) in options:
+            return
+        schema = next(option for option in options if option is not type(None))
+        origin = get_origin(schema)
+    
+    if value is None:
+        raise ValueError(f"{path} must not be null")
+    if origin in (list, List):
+        if not isinstance(value, list):
+            raise ValueError(f"{path} must be an array")
+        item_schema = get_args(schema)[0]
+        for i, item in enumerate(value):
+            _check_schema(item, item_schema, f"{path}[{i}]")
+    elif isinstance(schema, type) and issubclass(schema, dict):
+        if not isinstance(value, dict):
+            raise ValueError(f"{path} must be an object")
+        for key, field_schema in get_type_hints(schema).items():
+            if key not in value:
+                raise ValueError(f"{path}.{key} is missing")
+            _check_schema(value[key], field_schema, f"{path}.{key}")
+    elif schema is int:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{path} must be a number")
+    elif schema is str:
+        if not isinstance(value, str):
+            raise ValueError(f"{path} must be a string")
+
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the event loop that runs all Gemini requests, starting it on first use.
+    A single long-lived loop (rather than asyncio.run per call) lets concurrent
+    Flask requests share one loop and keeps the async HTTP sessions alive.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="ai-event-loop", daemon=True).start()
+    return _loop
+
+
+def _run(coro):
+    """Run a coroutine on the shared event loop from synchronous code and wait for it."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_event_loop()).result()
+
+
+def _generation_cache_key(model_name: str, prompt: str, generation_config: Dict[str, Any]) -> str:
+    """Content-addressed cache key for one generation request."""
+    return make_cache_key(
+        model_name,
+        PROMPT_VERSION,
+        generation_config.get("temperature"),
+        generation_config.get("max_output_tokens"),
+        generation_config.get("system_instruction"),
+        prompt,
+    )
+
+
+# Frozen generation config dict -> SDK config object. Feature configs are fixed,
+# so this holds one entry per feature (plus per batch size for array configs).
+_sdk_configs: Dict[frozenset, Any] = {}
+
+
+def _sdk_generation_config(config: Dict[str, Any]):
+    """
+    Return the SDK config object (GenerateContentConfig for the GenAI client,
+    GenerationConfig for google.generativeai) for a config dict, built once per
+    distinct config instead of on every call.
+    """
+    key = frozenset(config.items())
+    sdk_config = _sdk_configs.get(key)
+    if sdk_config is None:
+        if GENAI_CLIENT_AVAILABLE:
+            from google.genai import types as genai_types
+            sdk_config = genai_types.GenerateContentConfig(**config)
+        else:
+            sdk_config = _genai().types.GenerationConfig(**config)
+        _sdk_configs[key] = sdk_config
+    return sdk_config
+
+
+async def _generate_text_async(model_name: str, prompt: str, generation_config: Dict[str, Any], service_tier: Optional[str] = None) -> str:
+    """
+    Run a single generation and return the raw response text.
+    Uses the GenAI async client when installed (required for service tiers);
+    otherwise google.generativeai, where the system instruction belongs to the
+    model rather than the generation config. JSON-mode requests are streamed
+    (see _stream_json_async).
+    """
+    if generation_config.get("response_mime_type") == "application/json":
+        return await _stream_json_async(model_name, prompt, generation_config, service_tier)
+    
+    if GENAI_CLIENT_AVAILABLE:
+        config = dict(generation_config)
+        if service_tier:
+            config['service_tier'] = service_tier
+        response = await _get_client().aio.models.generate_content(model=model_name, contents=prompt, config=_sdk_generation_config(config))
+    else:
+        config = dict(generation_config)
+        system_instruction = config.pop('system_instruction', None)
+        model = _get_model(model_name, system_instruction)
+        response = await model.generate_content_async(
+            prompt,
+            generation_config=_sdk_generation_config(config)
+        )
+    return response.text if hasattr(response, 'text') else str(response)
+
+
+async def _cached_generate_async(
+    feature: str,
+    model_name: str,
+    prompt: str,
+    generation_config: Dict[str, Any],
+    service_tier: Optional[str] = None,
+    validate: Optional[Callable[[str], Any]] = None
+) -> str:
+    """
+    _generate_text_async with a content-addressed cache in front of it.
+    validate is run on cached text before it is returned (entries that no
+    longer parse are evicted) and on fresh text before it is stored. Fresh
+    text that fails validation is sent back to the model with the error,
+    up to MAX_VALIDATION_RETRIES times.
+    """
+    cache_key = _generation_cache_key(model_name, prompt, generation_config)
+    
+    cached_text = cache_get(cache_key)
+    if cached_text is not None:
+        try:
+            if validate:
+                validate(cached_text)
+            logger.debug("AI cache hit (%s)", feature)
+            return cached_text
+        except Exception as e:
+            logger.warning("Evicting invalid AI cache entry (%s): %s", feature, e)
+            cache_delete(cache_key)
+    
+    attempt_prompt = prompt
+    for attempt in range(MAX_VALIDATION_RETRIES + 1):
+        raw_response_text = await _generate_text_async(model_name, attempt_prompt, generation_config, service_tier)
+        try:
+            if validate:
+                validate(raw_response_text)
+        except Exception as e:
+            if attempt == MAX_VALIDATION_RETRIES:
+                logger.warning("AI response still invalid after %d attempts (%s): %s", attempt + 1, feature, e)
+                return raw_response_text
+            logger.warning("AI response failed validation (%s), retrying: %s", feature, e)
+            attempt_prompt = (
+                f"{prompt}\n\nYour previous output:\n{raw_response_text}\n\n"
+                f"Your output had error: {e}. Fix and retry."
+            )
+            continue
+        break
+    
+    if raw_response_text.strip():
+        cache_put(cache_key, raw_response_text)
+    
+    return raw_response_text
+
+
+async def _stream_text_async(model_name: str, prompt: str, generation_config: Dict[str, Any], service_tier: Optional[str] = None) -> AsyncIterator[str]:
+    """Streaming counterpart of _generate_text_async; yields text chunks as they are decoded."""
+    if GENAI_CLIENT_AVAILABLE:
+        config = dict(generation_config)
+        if service_tier:
+            config['service_tier'] = service_tier
+        stream = await _get_client().aio.models.generate_content_stream(model=model_name, contents=prompt, config=_sdk_generation_config(config))
+    else:
+        config = dict(generation_config)
+        system_instruction = config.pop('system_instruction', None)
+        model = _get_model(model_name, system_instruction)
+        stream = await model.generate_content_async(
+            prompt,
+            generation_config=_sdk_generation_config(config),
+            stream=True
+        )
+    async for chunk in stream:
+        text = getattr(chunk, 'text', None)
+        if text:
+            yield text
+
+
+class _JsonBraceTracker:
+    """
+    Incremental bracket-depth tracker for JSON text arriving in chunks.
+    Quotes and escapes are tracked so braces inside strings are ignored.
+    """
+    
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, chunk: str) -> int:
+        """Return the index in chunk just past the end of the top-level value, or -1."""
+        for i, ch in enumerate(chunk):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = self.started
+            elif ch == '{' or ch == '[':
+                self.depth += 1
+                self.started = True
+            elif (ch == '}' or ch == ']') and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
+
+async def _stream_json_async(model_name: str, prompt: str, generation_config: Dict[str, Any], service_tier: Optional[str] = None) -> str:
+    """
+    Stream a JSON-mode generation and return its text as soon as the top-level
+    value is closed, instead of waiting for the response to finish.
+    """
+    buffer = io.StringIO()
+    tracker = _JsonBraceTracker()
+    stream = _stream_text_async(model_name, prompt, generation_config, service_tier)
+    try:
+        async for chunk in stream:
+            end = tracker.feed(chunk)
+            if end >= 0:
+                buffer.write(chunk[:end])
+                break
+            buffer.write(chunk)
+    finally:
+        await stream.aclose()
+    return buffer.getvalue()
+
+
+def _cached_generate(
+    feature: str,
+    model_name: str,
+    prompt: str,
+    generation_config: Dict[str, Any],
+    service_tier: Optional[str] = None,
+    validate: Optional[Callable[[str], Any]] = None
+) -> str:
+    """Synchronous wrapper around _cached_generate_async."""
+    return _run(_cached_generate_async(feature, model_name, prompt, generation_config, service_tier, validate))
 
 
 def log_prompt_and_response(prompt: str, response: str, feature: str) -> None:
-    """Log prompts and responses for debugging (can be extended to write to file)."""
-    print(f"[AI {feature}] Prompt length: {len(prompt)} chars")
-    print(f"[AI {feature}] Response length: {len(response)} chars")
-    # In production, you might want to log to a file or database
+    """Log prompt/response sizes and record a trace entry in the ring buffer."""
+    logger.debug("[AI %s] prompt=%d chars resp=%d chars", feature, len(prompt), len(response))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[AI %s] raw response: %s", feature, response)
+    record = {
+        "ts": time.time(),
+        "feature": feature,
+        "prompt_chars": len(prompt),
+        "response_chars": len(response),
+    }
+    _ai_trace.append(orjson.dumps(record) if ORJSON_AVAILABLE else json.dumps(record).encode('utf-8'))
 
 
-def extract_cv_data_deep(cv_text: str) -> Dict[str, Any]:
+def get_ai_trace(limit: int = 100) -> List[Dict[str, Any]]:
+    """Return the most recent trace records, newest last."""
+    records = list(_ai_trace)[-limit:] if limit > 0 else []
+    return [_json_loads(record) for record in records]
+
+
+def extract_cv_data_deep(cv_text: str, service_tier: Optional[str] = SERVICE_TIER_FLEX) -> Dict[str, Any]:
     """
     Deep CV extraction using Google Gemini API.
     Extracts ALL professional information for complete About Me profile.
@@ -58,299 +748,470 @@ def extract_cv_data_deep(cv_text: str) -> Dict[str, Any]:
     - Capture identity, intent, strengths, and career narrative
     - If data is missing → return null or empty arrays
     - No guessing, no filler text
+    
+    Runs on the Flex service tier unless service_tier is overridden.
     """
-    if not is_ai_available():
-        return _get_empty_profile_structure()
+    return _run(extract_cv_data_deep_async(cv_text, service_tier))
+
+
+def batch_extract_cv_data_deep(cv_texts: List[str], service_tier: Optional[str] = SERVICE_TIER_FLEX) -> List[Dict[str, Any]]:
+    """Deep-extract several CVs concurrently; returns one profile per CV, in input order."""
+    async def gather_profiles():
+        return await asyncio.gather(*(extract_cv_data_deep_async(cv_text, service_tier) for cv_text in cv_texts))
     
+    return list(_run(gather_profiles()))
+
+
+async def extract_cv_data_deep_async(cv_text: str, service_tier: Optional[str] = SERVICE_TIER_FLEX) -> Dict[str, Any]:
+    """Async version of extract_cv_data_deep; all section prompts run concurrently."""
     if not cv_text or len(cv_text.strip()) < 50:
         return _get_empty_profile_structure()
     
+    if len(cv_text) < SHORT_CV_CHARS:
+        # No model call here, so the name heuristic is the only source of a name
+        regex_identity = dict(_extract_identity_regex(cv_text), name=_guess_name(cv_text))
+        if _is_contact_only(cv_text, regex_identity):
+            logger.info("Short contact-only CV; using regex identity without the model")
+            return _normalize_profile_structure({"identity": regex_identity})
+    
+    if not _AI_READY:
+        return _get_empty_profile_structure()
+    
     try:
-        model = genai.GenerativeModel('models/gemini-1.5-pro')
-        
-        # Limit text to 8000 chars for API
-        cv_text_limited = cv_text[:8000] if len(cv_text) > 8000 else cv_text
-        
-        prompt = f"""Extract COMPLETE professional information from this CV/resume. Extract ALL information that a recruiter would expect in a professional "About Me" profile.
-
-CV TEXT:
-{cv_text_limited}
-
-EXTRACTION REQUIREMENTS:
-Extract ALL of the following, even if some sections are missing:
-
-1. IDENTITY:
-   - Full Name
-   - Email
-   - Phone (if present)
-   - Location (city/country if present)
-   - LinkedIn, GitHub, Portfolio links (if present)
-
-2. PROFESSIONAL SUMMARY:
-   - Rewrite into clean 3-5 line recruiter-friendly bio
-   - Use ONLY CV content
-   - Do NOT hallucinate
-
-3. SKILLS (categorized):
-   - Technical Skills (programming languages, technologies)
-   - Tools & Frameworks
-   - Soft Skills (ONLY if explicitly mentioned in CV)
-
-4. EXPERIENCE (array of objects):
-   - Company name
-   - Role/title
-   - Duration (if present)
-   - Key responsibilities (bulleted, concise)
-
-5. EDUCATION (array of objects):
-   - Degree
-   - Institution
-   - Year (if present)
-   - Specialization (if present)
-
-6. PROJECTS (array of objects):
-   - Project name
-   - Tech stack
-   - One-line impact summary
-
-7. ACHIEVEMENTS/CERTIFICATIONS:
-   - Only if mentioned in CV
-
-CRITICAL RULES:
-1. Return ONLY valid JSON, no markdown, no code blocks
-2. If a value is NOT FOUND in the CV, use null (NOT empty strings "" or empty arrays [])
-3. Only include actual data found in the CV
-4. Do NOT invent or hallucinate any values
-5. Do NOT add filler text
-6. Extract everything that exists, nothing that doesn't
-7. Keep all text professional and recruiter-friendly
-8. For arrays: use null if no items found, otherwise return array with items
-9. For strings: use null if not found, otherwise return the actual string value
-
-OUTPUT FORMAT (JSON only - STRICT STRUCTURE):
-{{
-  "identity": {{
-    "name": null,
-    "email": null,
-    "phone": null,
-    "location": null,
-    "links": null
-  }},
-  "professional_summary": null,
-  "skills": {{
-    "technical": null,
-    "tools": null,
-    "soft": null
-  }},
-  "experience": null,
-  "education": null,
-  "projects": null,
-  "achievements": null
-}}
-
-IMPORTANT: Replace null with actual values ONLY if found in the CV. If not found, keep as null."""
-        
-        response = model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.1,  # Low temperature for deterministic extraction
-                max_output_tokens=4000,
-            )
-        )
+        section_inputs = await asyncio.to_thread(_cv_section_inputs, cv_text)
         
-        # Log raw response before any processing
-        raw_response_text = response.text if hasattr(response, 'text') else str(response)
-        print(f"[INFO] Raw Gemini response (DEEP_CV_EXTRACTION):")
-        print(f"[RAW_RESPONSE] {raw_response_text}")
-        print(f"[INFO] Raw response length: {len(raw_response_text)} chars")
+        # Deterministic identity fields (email, phone, links, labelled location)
+        # come from regex and are passed to the identity call as known values.
+        # The name is never deterministic, so that call is always made.
+        regex_identity = _extract_identity_regex(cv_text)
         
-        response_text = raw_response_text.strip()
-        log_prompt_and_response(prompt, response_text, "DEEP_CV_EXTRACTION")
-        
-        print(f"[INFO] Processed response length: {len(response_text)} chars")
+        # Each section is extracted by its own focused prompt; run them concurrently
+        # so wall time is the slowest section rather than the sum of all of them.
+        section_tasks = {
+            "summary": _extract_career_and_summary(section_inputs["summary"], service_tier),
+            "skills": _extract_skills(section_inputs["skills"], service_tier),
+            "experience_education": _extract_experience_education(section_inputs["experience_education"], service_tier),
+            "projects_achievements": _extract_projects_achievements(section_inputs["projects_achievements"], service_tier),
+            "identity": _extract_identity(section_inputs["identity"], service_tier, regex_identity),
+        }
         
-        # Remove markdown code blocks if present
-        if response_text.startswith('```'):
-            response_text = response_text.split('```')[1]
-            if response_text.startswith('json'):
-                response_text = response_text[4:]
-            response_text = response_text.strip()
-        elif response_text.startswith('```json'):
-            response_text = response_text[7:].strip()
-            if response_text.endswith('```'):
-                response_text = response_text[:-3].strip()
+        results = await asyncio.gather(*section_tasks.values(), return_exceptions=True)
         
-        # Parse JSON
-        try:
-            extracted_data = json.loads(response_text)
-            print(f"[INFO] Successfully parsed JSON from Gemini response")
-        except json.JSONDecodeError as e:
-            print(f"[WARNING] JSON parse error: {e}")
-            print(f"[DEBUG] Response text (first 500 chars): {response_text[:500]}")
-            # Try to extract JSON from the response
-            json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', response_text, re.DOTALL)
-            if json_match:
-                try:
-                    extracted_data = json.loads(json_match.group(0))
-                    print(f"[INFO] Successfully extracted JSON using regex")
-                except json.JSONDecodeError:
-                    raise ValueError(f"Could not parse JSON from Gemini response: {e}")
+        extracted_data = {}
+        for name, result in zip(section_tasks, results):
+            if isinstance(result, Exception):
+                logger.warning("CV section extraction failed (%s): %s", name, result)
             else:
-                raise ValueError(f"Could not find JSON in Gemini response: {e}")
+                extracted_data.update(result)
         
-        # Validate that we got some data
-        if not extracted_data or not isinstance(extracted_data, dict):
-            print(f"[ERROR] Extracted data is not a valid dict: {type(extracted_data)}")
+        if not extracted_data:
+            logger.error("All CV section extractions failed")
             return _get_empty_profile_structure()
         
-        # Log what was extracted
-        print(f"[INFO] Extracted data keys: {list(extracted_data.keys())}")
+        # Regex matches win over model output for the fields they cover
+        llm_identity = extracted_data.get("identity")
+        if not isinstance(llm_identity, dict):
+            llm_identity = {}
+        identity = {
+            key: regex_identity[key] if regex_identity[key] else llm_identity.get(key)
+            for key in regex_identity
+        }
+        # The first-lines name guess is only a fallback for a missing model answer
+        if not identity["name"]:
+            identity["name"] = _guess_name(cv_text)
+        extracted_data["identity"] = identity
+        
+        return _finalize_profile(extracted_data)
+    
+    except Exception as e:
+        logger.error("Error in deep CV extraction: %s", e)
+        return _get_empty_profile_structure()
+
+
+async def _extract_cv_section(section: str, prompt: str, schema: type, service_tier: Optional[str]) -> Dict[str, Any]:
+    """Run one CV section prompt in JSON mode and return its parsed object."""
+    raw_response_text = await _cached_generate_async(
+        f"DEEP_CV_{section}", _MODEL_MAP['DEEP_CV'], prompt,
+        _json_generation_config(CV_SECTION_GENERATION_CONFIG, schema), service_tier,
+        validate=lambda text: _validate_cv_section(text, schema)
+    )
+    
+    log_prompt_and_response(prompt, raw_response_text.strip(), f"DEEP_CV_{section}")
+    return _validate_cv_section(raw_response_text, schema)
+
+
+def _validate_cv_section(raw_response_text: str, schema: type) -> Dict[str, Any]:
+    """Parse a CV section response, check it against its schema and the normalizer."""
+    data = _parse_llm_json(raw_response_text)
+    _check_schema(data, schema)
+    _normalize_profile_structure(data)
+    return data
+
+
+def _extract_identity_regex(cv_text: str) -> Dict[str, Any]:
+    """
+    Read identity fields that are regex-addressable (email, phone, links, a
+    labelled location). The name and any field not found are None.
+    """
+    identity = dict(_EMPTY_PROFILE_TEMPLATE["identity"])
+    
+    email_match = _EMAIL_RE.search(cv_text)
+    if email_match:
+        identity["email"] = email_match.group(0)
+    
+    for phone_match in _PHONE_RE.finditer(cv_text):
+        digits = sum(ch.isdigit() for ch in phone_match.group(0))
+        if 9 <= digits <= 15:
+            identity["phone"] = phone_match.group(0).strip()
+            break
+    
+    links = []
+    for pattern in (_LINKEDIN_RE, _GITHUB_RE, _URL_RE):
+        for link_match in pattern.finditer(cv_text):
+            link = link_match.group(0).rstrip('.')
+            if not any(link in existing or existing in link for existing in links):
+                links.append(link)
+    identity["links"] = links or None
+    
+    location_match = _LOCATION_RE.search(cv_text)
+    if location_match:
+        identity["location"] = location_match.group(1)
+    
+    return identity
+
+
+def _guess_name(cv_text: str) -> Optional[str]:
+    """
+    Guess the name from the first short line of capitalised words near the top
+    of the CV. Unreliable (titles and headings look the same), so only used
+    when the model gives no name or is not called.
+    """
+    for line in cv_text.lstrip().split("\n", 5)[:5]:
+        line = line.strip()
+        if line and _NAME_LINE_RE.match(line) and not _CV_SECTION_HEADER_RE.match(line):
+            return line
+    return None
+
+
+def _is_contact_only(cv_text: str, identity: Dict[str, Any]) -> bool:
+    """
+    True if every non-blank line of cv_text is accounted for by the regex
+    identity (name, email, phone, location, links) plus at most a short label.
+    """
+    values = [value for key, value in identity.items() if key != "links" and value]
+    values += identity.get("links") or []
+    if not values:
+        return False
+    for line in cv_text.splitlines():
+        for value in values:
+            line = line.replace(value, " ")
+        if len(_WORD_RE.findall(line)) > _CONTACT_LABEL_WORDS:
+            return False
+    return True
+
+
+async def _extract_identity(cv_text: str, service_tier: Optional[str] = SERVICE_TIER_FLEX, known_identity: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Extract name, contact details and links.
+    Fields already found by _extract_identity_regex are passed in as
+    known_identity so the model only has to fill in the rest.
+    """
+    already_extracted = ""
+    if known_identity:
+        known = {key: value for key, value in known_identity.items() if value}
+        if known:
+            already_extracted = f"\nAlready extracted (copy as-is, only fill in the missing fields): {json.dumps(known)}\n"
+    
+    prompt = f"""Extract the candidate's identity and contact details: full name, email, phone,
+location (city/country) and LinkedIn/GitHub/portfolio links.
+{already_extracted}
+CV TEXT:
+{cv_text}"""
+    return await _extract_cv_section("IDENTITY", prompt, IdentitySectionSchema, service_tier)
+
+
+async def _extract_career_and_summary(cv_text: str, service_tier: Optional[str] = SERVICE_TIER_FLEX) -> Dict[str, Any]:
+    """Extract the recruiter-friendly professional summary."""
+    prompt = f"""Rewrite this CV into a clean 3-5 line recruiter-friendly professional summary,
+using ONLY CV content.
+
+CV TEXT:
+{cv_text}"""
+    return await _extract_cv_section("SUMMARY", prompt, SummarySectionSchema, service_tier)
+
+
+async def _extract_skills(cv_text: str, service_tier: Optional[str] = SERVICE_TIER_FLEX) -> Dict[str, Any]:
+    """Extract categorized skills."""
+    prompt = f"""Extract the candidate's skills: technical skills (programming languages, technologies),
+tools & frameworks, and soft skills (ONLY if explicitly mentioned).
+
+CV TEXT:
+{cv_text}"""
+    return await _extract_cv_section("SKILLS", prompt, SkillsSectionSchema, service_tier)
+
+
+async def _extract_experience_education(cv_text: str, service_tier: Optional[str] = SERVICE_TIER_FLEX) -> Dict[str, Any]:
+    """
+    Extract experience and education.
+    Responsibilities come back as [start_line, end_line] pointers into the
+    numbered CV text and are resolved locally, so the model does not have to
+    regenerate long verbatim bullet points.
+    """
+    cv_lines = cv_text.splitlines()
+    numbered_cv = "\n".join(f"{i}: {line}" for i, line in enumerate(cv_lines, 1))
+    
+    prompt = f"""Extract work experience (company, role, duration) and education (degree, institution,
+year, specialization). Each CV line is prefixed with its line number; give each responsibility
+bullet as a [start_line, end_line] pair in responsibility_lines instead of copying its text.
+
+CV TEXT:
+{numbered_cv}"""
+    data = await _extract_cv_section("EXPERIENCE_EDUCATION", prompt, ExperienceEducationSectionSchema, service_tier)
+    
+    experience = data.get("experience")
+    if isinstance(experience, list):
+        for exp in experience:
+            if isinstance(exp, dict) and "responsibilities" not in exp:
+                exp["responsibilities"] = _resolve_line_ranges(cv_lines, exp.pop("responsibility_lines", None))
+    return data
+
+
+def _resolve_line_ranges(cv_lines: List[str], line_ranges: Any) -> Optional[List[str]]:
+    """Turn [start_line, end_line] pairs (1-based, inclusive) into text, one entry per pair."""
+    if not isinstance(line_ranges, list):
+        return None
+    
+    resolved = []
+    for line_range in line_ranges:
+        if not isinstance(line_range, (list, tuple)) or not line_range:
+            continue
+        try:
+            start = int(line_range[0])
+            end = int(line_range[-1])
+        except (TypeError, ValueError):
+            continue
+        start = max(start, 1)
+        end = min(end, len(cv_lines))
+        if start > end:
+            continue
+        text = " ".join(line.strip() for line in cv_lines[start - 1:end] if line.strip())
+        text = text.lstrip("-•*·▪● ").strip()
+        if text:
+            resolved.append(text)
+    return resolved or None
+
+
+async def _extract_projects_achievements(cv_text: str, service_tier: Optional[str] = SERVICE_TIER_FLEX) -> Dict[str, Any]:
+    """Extract projects and achievements/certifications."""
+    prompt = f"""Extract projects (name, tech stack, one-line impact summary) and any
+achievements/certifications mentioned.
+
+CV TEXT:
+{cv_text}"""
+    return await _extract_cv_section("PROJECTS_ACHIEVEMENTS", prompt, ProjectsAchievementsSectionSchema, service_tier)
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} span in text, found in a single pass
+    (braces inside JSON strings are ignored), or None if there is none.
+    """
+    start = text.find('{')
+    if start < 0:
+        return None
+    end = _JsonBraceTracker().feed(text[start:])
+    return text[start:start + end] if end >= 0 else None
+
+
+def _parse_llm_json(raw_response_text: str) -> Any:
+    """
+    Parse JSON out of a model response.
+    JSON-mode responses parse directly; code fences and surrounding prose are
+    only handled as a fallback. Raises ValueError if no JSON can be recovered.
+    """
+    try:
+        return _json_loads(raw_response_text)
+    except json.JSONDecodeError as e:
+        response_text = _strip_fences(raw_response_text)
+        try:
+            return _json_loads(response_text)
+        except json.JSONDecodeError:
+            pass
+        json_object = _find_json_object(response_text)
+        if json_object:
+            try:
+                return _json_loads(json_object)
+            except json.JSONDecodeError:
+                raise ValueError(f"Could not parse JSON from Gemini response: {e}")
+        raise ValueError(f"Could not find JSON in Gemini response: {e}")
+
+
+def _build_prompt_deep_cv(cv_text: str) -> Tuple[str, str, Dict[str, Any]]:
+    """Build the (feature, prompt, generation_config) triple for deep CV extraction."""
+    cv_text_limited = _truncate_to_tokens(cv_text, CV_TOKEN_BUDGET)
+    
+    prompt = f"""Extract complete professional information from this CV/resume:
+- identity: full name, email, phone, location, LinkedIn/GitHub/portfolio links
+- professional_summary: clean 3-5 line recruiter-friendly bio from CV content only
+- skills: technical, tools & frameworks, soft (only if explicitly mentioned)
+- experience: company, role, duration, concise key responsibilities
+- education: degree, institution, year, specialization
+- projects: name, tech stack, one-line impact summary
+- achievements/certifications
+
+CV TEXT:
+{cv_text_limited}"""
+    
+    return "DEEP_CV_EXTRACTION", prompt, DEEP_CV_GENERATION_CONFIG
+
+
+def _parse_deep_cv_response(raw_response_text: str) -> Dict[str, Any]:
+    """
+    Parse and normalize a raw deep CV extraction response.
+    Raises ValueError if no JSON can be recovered from the response.
+    """
+    extracted_data = _parse_llm_json(raw_response_text)
+    
+    # Validate that we got some data
+    if not extracted_data or not isinstance(extracted_data, dict):
+        logger.error("Extracted data is not a valid dict: %s", type(extracted_data))
+        return _get_empty_profile_structure()
+    
+    return _finalize_profile(extracted_data)
+
+
+def _finalize_profile(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Log, normalize and sanity-check extracted profile data."""
+    # Log what was extracted
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Extracted data keys: %s", list(extracted_data.keys()))
         identity_data = extracted_data.get("identity", {})
         if identity_data and isinstance(identity_data, dict):
             name_val = identity_data.get("name")
-            print(f"[INFO] Identity name extracted: {name_val is not None and name_val != ''}")
+            logger.debug("Identity name extracted: %s", name_val is not None and name_val != '')
         prof_summary = extracted_data.get("professional_summary")
         if prof_summary is not None and prof_summary != "":
-            print(f"[INFO] Professional summary extracted: {len(str(prof_summary))} chars")
+            logger.debug("Professional summary extracted: %d chars", len(str(prof_summary)))
         experience_data = extracted_data.get("experience")
         if experience_data is not None and isinstance(experience_data, list):
-            print(f"[INFO] Experience entries: {len(experience_data)}")
+            logger.debug("Experience entries: %d", len(experience_data))
         skills_data = extracted_data.get("skills", {})
         if skills_data and isinstance(skills_data, dict):
             technical_skills = skills_data.get("technical")
             if technical_skills is not None and isinstance(technical_skills, list):
-                print(f"[INFO] Skills extracted: {len(technical_skills)} technical")
-        
-        # Validate and normalize structure
-        normalized = _normalize_profile_structure(extracted_data)
-        
-        # Final validation - check if we got any meaningful data
-        identity = normalized.get("identity", {})
-        skills = normalized.get("skills", {})
-        experience = normalized.get("experience")
-        has_data = (
-            (identity.get("name") is not None and identity.get("name") != "") or
-            (normalized.get("professional_summary") is not None and normalized.get("professional_summary") != "") or
-            (experience is not None and isinstance(experience, list) and len(experience) > 0) or
-            (skills.get("technical") is not None and isinstance(skills.get("technical"), list) and len(skills.get("technical", [])) > 0)
-        )
-        
-        if not has_data:
-            print(f"[WARNING] Extracted data appears to be empty after normalization (all values are null)")
-        
-        return normalized
+                logger.debug("Skills extracted: %d technical", len(technical_skills))
     
-    except Exception as e:
-        print(f"Error in deep CV extraction: {e}")
-        return _get_empty_profile_structure()
+    # Validate and normalize structure
+    normalized = _normalize_profile_structure(extracted_data)
+    
+    # Final validation - check if we got any meaningful data
+    identity = normalized.get("identity", {})
+    skills = normalized.get("skills", {})
+    experience = normalized.get("experience")
+    has_data = (
+        (identity.get("name") is not None and identity.get("name") != "") or
+        (normalized.get("professional_summary") is not None and normalized.get("professional_summary") != "") or
+        (experience is not None and isinstance(experience, list) and len(experience) > 0) or
+        (skills.get("technical") is not None and isinstance(skills.get("technical"), list) and len(skills.get("technical", [])) > 0)
+    )
+    
+    if not has_data:
+        logger.warning("Extracted data appears to be empty after normalization (all values are null)")
+    
+    return normalized
+
+
+# Shared empty profile. Treat as read-only; use _get_empty_profile_structure()
+# for a copy that can be modified.
+_EMPTY_PROFILE_TEMPLATE = {
+    "identity": {
+        "name": None,
+        "email": None,
+        "phone": None,
+        "location": None,
+        "links": None
+    },
+    "professional_summary": None,
+    "skills": {
+        "technical": None,
+        "tools": None,
+        "soft": None
+    },
+    "experience": None,
+    "education": None,
+    "projects": None,
+    "achievements": None
+}
 
 
 def _get_empty_profile_structure() -> Dict[str, Any]:
-    """Return empty profile structure with null values."""
-    return {
-        "identity": {
-            "name": None,
-            "email": None,
-            "phone": None,
-            "location": None,
-            "links": None
-        },
-        "professional_summary": None,
-        "skills": {
-            "technical": None,
-            "tools": None,
-            "soft": None
-        },
-        "experience": None,
-        "education": None,
-        "projects": None,
-        "achievements": None
-    }
+    """Return a mutable copy of the empty profile structure with null values."""
+    return copy.deepcopy(_EMPTY_PROFILE_TEMPLATE)
+
+
+# Field tables for _normalize_profile_structure: (string fields, list-of-string fields)
+_IDENTITY_FIELDS = (("name", "email", "phone", "location"), ("links",))
+_SKILLS_FIELDS = ((), ("technical", "tools", "soft"))
+_EXPERIENCE_FIELDS = (("company", "role", "duration"), ("responsibilities",))
+_EDUCATION_FIELDS = (("degree", "institution", "year", "specialization"), ())
+_PROJECT_FIELDS = (("name", "tech_stack", "impact"), ())
+
+
+def _s(d: Dict[str, Any], key: str) -> Optional[str]:
+    """Stripped string value of d[key], or None if missing/empty."""
+    value = d.get(key)
+    if value is None or value == "":
+        return None
+    return value.strip() if isinstance(value, str) else str(value).strip()
+
+
+def _sl(d: Dict[str, Any], key: str) -> Optional[List[str]]:
+    """Stripped non-empty strings from the list d[key], or None if it is not a list."""
+    value = d.get(key)
+    if not isinstance(value, list):
+        return None
+    return [str(item).strip() for item in value if item]
+
+
+def _normalize_record(d: Dict[str, Any], fields: Tuple[Tuple[str, ...], Tuple[str, ...]]) -> Dict[str, Any]:
+    """Normalize one record using a (string fields, list fields) table."""
+    str_fields, list_fields = fields
+    record = {key: _s(d, key) for key in str_fields}
+    for key in list_fields:
+        record[key] = _sl(d, key)
+    return record
+
+
+def _normalize_records(items: Any, fields: Tuple[Tuple[str, ...], Tuple[str, ...]]) -> Optional[List[Dict[str, Any]]]:
+    """Normalize each dict in a list of records; None if items is not a list."""
+    if not isinstance(items, list):
+        return None
+    return [_normalize_record(item, fields) for item in items if isinstance(item, dict)]
 
 
 def _normalize_profile_structure(data: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize and validate extracted profile structure. Preserves null values."""
-    result = _get_empty_profile_structure()
-    
-    # Identity
-    if "identity" in data and isinstance(data["identity"], dict):
-        identity = data["identity"]
-        result["identity"] = {
-            "name": str(identity.get("name")).strip() if identity.get("name") is not None and identity.get("name") != "" else None,
-            "email": str(identity.get("email")).strip() if identity.get("email") is not None and identity.get("email") != "" else None,
-            "phone": str(identity.get("phone")).strip() if identity.get("phone") is not None and identity.get("phone") != "" else None,
-            "location": str(identity.get("location")).strip() if identity.get("location") is not None and identity.get("location") != "" else None,
-            "links": [str(link).strip() for link in identity.get("links") if link] if isinstance(identity.get("links"), list) and identity.get("links") is not None else None
-        }
+    identity = data.get("identity")
+    skills = data.get("skills")
+    achievements = data.get("achievements")
     
-    # Professional Summary
-    if "professional_summary" in data:
-        prof_summary = data.get("professional_summary")
-        result["professional_summary"] = str(prof_summary).strip() if prof_summary is not None and prof_summary != "" else None
-    
-    # Skills
-    if "skills" in data and isinstance(data["skills"], dict):
-        skills = data["skills"]
-        result["skills"] = {
-            "technical": [str(s).strip() for s in skills.get("technical") if s] if isinstance(skills.get("technical"), list) and skills.get("technical") is not None else None,
-            "tools": [str(s).strip() for s in skills.get("tools") if s] if isinstance(skills.get("tools"), list) and skills.get("tools") is not None else None,
-            "soft": [str(s).strip() for s in skills.get("soft") if s] if isinstance(skills.get("soft"), list) and skills.get("soft") is not None else None
-        }
+    if isinstance(achievements, list):
+        achievements = _sl(data, "achievements") or None
+    elif isinstance(achievements, str):
+        achievements = achievements.strip()
+        achievements = [achievements] if achievements else None
+    else:
+        achievements = None
     
-    # Experience
-    if "experience" in data:
-        if isinstance(data["experience"], list) and data["experience"] is not None:
-            result["experience"] = [
-                {
-                    "company": str(exp.get("company")).strip() if exp.get("company") is not None and exp.get("company") != "" else None,
-                    "role": str(exp.get("role")).strip() if exp.get("role") is not None and exp.get("role") != "" else None,
-                    "duration": str(exp.get("duration")).strip() if exp.get("duration") is not None and exp.get("duration") != "" else None,
-                    "responsibilities": [str(r).strip() for r in exp.get("responsibilities") if r] if isinstance(exp.get("responsibilities"), list) and exp.get("responsibilities") is not None else None
-                }
-                for exp in data["experience"] if isinstance(exp, dict)
-            ]
-        else:
-            result["experience"] = None
-    
-    # Education
-    if "education" in data:
-        if isinstance(data["education"], list) and data["education"] is not None:
-            result["education"] = [
-                {
-                    "degree": str(edu.get("degree")).strip() if edu.get("degree") is not None and edu.get("degree") != "" else None,
-                    "institution": str(edu.get("institution")).strip() if edu.get("institution") is not None and edu.get("institution") != "" else None,
-                    "year": str(edu.get("year")).strip() if edu.get("year") is not None and edu.get("year") != "" else None,
-                    "specialization": str(edu.get("specialization")).strip() if edu.get("specialization") is not None and edu.get("specialization") != "" else None
-                }
-                for edu in data["education"] if isinstance(edu, dict)
-            ]
-        else:
-            result["education"] = None
-    
-    # Projects
-    if "projects" in data:
-        if isinstance(data["projects"], list) and data["projects"] is not None:
-            result["projects"] = [
-                {
-                    "name": str(proj.get("name")).strip() if proj.get("name") is not None and proj.get("name") != "" else None,
-                    "tech_stack": str(proj.get("tech_stack")).strip() if proj.get("tech_stack") is not None and proj.get("tech_stack") != "" else None,
-                    "impact": str(proj.get("impact")).strip() if proj.get("impact") is not None and proj.get("impact") != "" else None
-                }
-                for proj in data["projects"] if isinstance(proj, dict)
-            ]
-        else:
-            result["projects"] = None
-    
-    # Achievements
-    if "achievements" in data:
-        if isinstance(data["achievements"], list) and data["achievements"] is not None:
-            result["achievements"] = [str(a).strip() for a in data["achievements"] if a] if len([a for a in data["achievements"] if a]) > 0 else None
-        elif isinstance(data["achievements"], str) and data["achievements"] is not None:
-            result["achievements"] = [data["achievements"].strip()] if data["achievements"].strip() else None
-        else:
-            result["achievements"] = None
-    
-    return result
+    return {
+        "identity": _normalize_record(identity if isinstance(identity, dict) else {}, _IDENTITY_FIELDS),
+        "professional_summary": _s(data, "professional_summary"),
+        "skills": _normalize_record(skills if isinstance(skills, dict) else {}, _SKILLS_FIELDS),
+        "experience": _normalize_records(data.get("experience"), _EXPERIENCE_FIELDS),
+        "education": _normalize_records(data.get("education"), _EDUCATION_FIELDS),
+        "projects": _normalize_records(data.get("projects"), _PROJECT_FIELDS),
+        "achievements": achievements
+    }
 
 
 def extract_cv_data(cv_text: str) -> Dict[str, Any]:
@@ -359,137 +1220,50 @@ def extract_cv_data(cv_text: str) -> Dict[str, Any]:
     Kept for backward compatibility.
     """
     return extract_cv_data_deep(cv_text)
-    if not is_ai_available():
-        return {
-            "name": "",
-            "email": "",
-            "phone": "",
-            "looking_for": "",
-            "bio": "",
-            "skills": [],
-            "experience_summary": ""
-        }
-    
-    if not cv_text or len(cv_text.strip()) < 50:
-        return {
-            "name": "",
-            "email": "",
-            "phone": "",
-            "looking_for": "",
-            "bio": "",
-            "skills": [],
-            "experience_summary": ""
-        }
-    
-    try:
-        model = genai.GenerativeModel('models/gemini-1.5-pro')
-        
-        # Limit text to 8000 chars for API
-        cv_text_limited = cv_text[:8000] if len(cv_text) > 8000 else cv_text
-        
-        prompt = f"""Extract structured information from this CV/resume text. Return ONLY valid JSON, no explanations.
-
-CV Text:
-{cv_text_limited}
-
-Extract and return the following fields as JSON:
-- name: Full name (string, or "" if not found)
-- email: Email address (string, or "" if not found)
-- phone: Phone number (string, or "" if not found)
-- looking_for: Current or target role/job title (string, or "" if not found)
-- bio: Professional summary in 2-4 lines, recruiter-friendly tone (string, or "" if not found)
-- skills: Array of technical/professional skills (array of strings, or [] if not found)
-- experience_summary: Brief experience summary (string, or "" if not found)
-
-CRITICAL RULES:
-1. Return ONLY valid JSON, no markdown, no code blocks
-2. If a field is not found in the CV, use empty string "" or empty array []
-3. Do NOT invent or hallucinate any values
-4. For bio: Only create if there's a summary/objective section in the CV
-5. For skills: Extract actual skills mentioned, return as array
-6. Keep all text professional and recruiter-friendly
-
-Return format (JSON only):
-{{
-  "name": "",
-  "email": "",
-  "phone": "",
-  "looking_for": "",
-  "bio": "",
-  "skills": [],
-  "experience_summary": ""
-}}"""
-        
-        response = model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.1,  # Low temperature for deterministic extraction
-                max_output_tokens=2000,
-            )
-        )
-        
-        # Log raw response before any processing
-        raw_response_text = response.text if hasattr(response, 'text') else str(response)
-        print(f"[INFO] Raw Gemini response (CV_EXTRACTION):")
-        print(f"[RAW_RESPONSE] {raw_response_text}")
-        print(f"[INFO] Raw response length: {len(raw_response_text)} chars")
-        
-        response_text = raw_response_text.strip()
-        log_prompt_and_response(prompt, response_text, "CV_EXTRACTION")
-        
-        # Remove markdown code blocks if present
-        if response_text.startswith('```'):
-            response_text = response_text.split('```')[1]
-            if response_text.startswith('json'):
-                response_text = response_text[4:]
-            response_text = response_text.strip()
-        elif response_text.startswith('```json'):
-            response_text = response_text[7:].strip()
-            if response_text.endswith('```'):
-                response_text = response_text[:-3].strip()
-        
-        # Parse JSON
-        try:
-            extracted_data = json.loads(response_text)
-        except json.JSONDecodeError:
-            # Try to extract JSON from the response
-            json_match = re.search(r'\{[^{}]*\}', response_text, re.DOTALL)
-            if json_match:
-                extracted_data = json.loads(json_match.group(0))
-            else:
-                raise ValueError("Could not parse JSON from Gemini response")
-        
-        # Validate and normalize the response
-        result = {
-            "name": str(extracted_data.get("name", "")).strip() if extracted_data.get("name") else "",
-            "email": str(extracted_data.get("email", "")).strip() if extracted_data.get("email") else "",
-            "phone": str(extracted_data.get("phone", "")).strip() if extracted_data.get("phone") else "",
-            "looking_for": str(extracted_data.get("looking_for", "")).strip() if extracted_data.get("looking_for") else "",
-            "bio": str(extracted_data.get("bio", "")).strip() if extracted_data.get("bio") else "",
-            "skills": extracted_data.get("skills", []) if isinstance(extracted_data.get("skills"), list) else [],
-            "experience_summary": str(extracted_data.get("experience_summary", "")).strip() if extracted_data.get("experience_summary") else ""
-        }
-        
-        # Clean skills array
-        if result["skills"]:
-            result["skills"] = [str(skill).strip() for skill in result["skills"] if skill and str(skill).strip()]
-        
-        return result
+
+
+def render_profile_card(about_me: Dict[str, Any]) -> str:
+    """
+    Render the candidate summary block used in cover letter and matching prompts.
+    Memoized on the profile's rendered fields, so generating for many jobs
+    with the same profile builds the text once.
+    """
+    skills = about_me.get('skills', [])
+    if isinstance(skills, str):
+        skills = [s.strip() for s in skills.split(',') if s.strip()]
+    experience = about_me.get('experience_summary', about_me.get('experience', 'N/A'))
+    if not isinstance(experience, (str, int, float, type(None))):
+        # Structured experience (e.g. entries with responsibilities arrays)
+        experience = _dump_json(experience)
     
-    except Exception as e:
-        print(f"Error in Gemini CV extraction: {e}")
-        return {
-            "name": "",
-            "email": "",
-            "phone": "",
-            "looking_for": "",
-            "bio": "",
-            "skills": [],
-            "experience_summary": ""
-        }
+    return _render_profile_card(
+        str(about_me.get('name', 'N/A')),
+        str(about_me.get('looking_for', 'N/A')),
+        str(about_me.get('bio', 'N/A')),
+        tuple(str(s) for s in skills) if isinstance(skills, list) else (),
+        experience
+    )
 
 
-def generate_cover_letter(about_me: Dict[str, Any], job_description: str, company_name: str, role_title: str) -> str:
+def _dump_json(value: Any) -> str:
+    """Compact JSON text for prompt interpolation (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str).decode('utf-8')
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+@lru_cache(maxsize=64)
+def _render_profile_card(name: str, looking_for: str, bio: str, skills: Tuple[str, ...], experience: Any) -> str:
+    return f"""
+Name: {name}
+Target Role: {looking_for}
+Professional Summary: {bio}
+Skills: {_dump_json(list(skills)) if skills else 'N/A'}
+Experience: {experience}
+"""
+
+
+def generate_cover_letter(about_me: Dict[str, Any], job_description: str, company_name: str, role_title: str, service_tier: Optional[str] = SERVICE_TIER_STANDARD) -> str:
     """
     Generate a customized, professional cover letter using Gemini AI.
     
@@ -498,26 +1272,36 @@ def generate_cover_letter(about_me: Dict[str, Any], job_description: str, compan
         job_description: Job description text
         company_name: Company name
         role_title: Job role/title
+        service_tier: Gemini service tier (standard by default, as this is interactive)
     
     Returns:
         Plain text cover letter (250-300 words)
     """
-    if not is_ai_available():
+    if not _AI_READY:
         return "AI service not available. Please configure GEMINI_API_KEY."
     
     try:
-        model = genai.GenerativeModel('models/gemini-1.5-pro')
+        _, prompt, generation_config = _build_prompt_cover_letter(about_me, job_description, company_name, role_title)
         
-        # Prepare about me summary
-        about_me_text = f"""
-Name: {about_me.get('name', 'N/A')}
-Target Role: {about_me.get('looking_for', 'N/A')}
-Professional Summary: {about_me.get('bio', 'N/A')}
-Skills: {', '.join(about_me.get('skills', [])) if isinstance(about_me.get('skills'), list) else about_me.get('skills', 'N/A')}
-Experience: {about_me.get('experience_summary', about_me.get('experience', 'N/A'))}
-"""
+        raw_response_text = _cached_generate(
+            "COVER_LETTER", _MODEL_MAP['COVER_LETTER'], prompt, generation_config, service_tier
+        )
         
-        prompt = f"""Generate a professional cover letter for a job application.
+        log_prompt_and_response(prompt, raw_response_text.strip(), "COVER_LETTER")
+        return _parse_cover_letter_response(raw_response_text)
+    
+    except Exception as e:
+        logger.error("Error generating cover letter: %s", e)
+        return f"Error generating cover letter: {str(e)}"
+
+
+def _build_prompt_cover_letter(about_me: Dict[str, Any], job_description: str, company_name: str, role_title: str) -> Tuple[str, str, Dict[str, Any]]:
+    """Build the (feature, prompt, generation_config) triple for cover letter generation."""
+    about_me_text = render_profile_card(about_me)
+    
+    prompt = f"""Write a cover letter (250-300 words) for this application. Align the candidate's
+skills and specific relevant experience with the job requirements and show genuine interest
+in the role and company. Start directly with the salutation (e.g., "Dear Hiring Manager,").
 
 CANDIDATE INFORMATION:
 {about_me_text}
@@ -527,57 +1311,19 @@ Company: {company_name}
 Role: {role_title}
 
 JOB DESCRIPTION:
-{job_description[:2000]}
-
-INSTRUCTIONS:
-1. Write a professional cover letter (250-300 words)
-2. Align candidate's skills with the job requirements
-3. Show genuine interest in the role and company
-4. Avoid buzzwords, clichés, and exaggeration
-5. Use confident, human, recruiter-friendly tone
-6. Be specific about relevant experience
-7. Keep it concise and impactful
-
-TONE:
-- Confident but not arrogant
-- Human and authentic
-- Professional and recruiter-friendly
-- No clichés like "I'm a team player" or "I'm passionate"
-
-OUTPUT:
-Return ONLY the cover letter text, no greetings, no explanations, no markdown formatting.
-Start directly with the salutation (e.g., "Dear Hiring Manager,").
+{_truncate_to_tokens(job_description, JD_TOKEN_BUDGET)}
 """
-        
-        response = model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.7,  # Slightly higher for creative writing
-                max_output_tokens=500,
-            )
-        )
-        
-        # Log raw response before any processing
-        raw_response_text = response.text if hasattr(response, 'text') else str(response)
-        print(f"[INFO] Raw Gemini response (COVER_LETTER):")
-        print(f"[RAW_RESPONSE] {raw_response_text}")
-        print(f"[INFO] Raw response length: {len(raw_response_text)} chars")
-        
-        cover_letter = raw_response_text.strip()
-        log_prompt_and_response(prompt, cover_letter, "COVER_LETTER")
-        
-        # Clean up the response
-        if cover_letter.startswith('```'):
-            cover_letter = cover_letter.split('```')[1]
-            if cover_letter.startswith('text'):
-                cover_letter = cover_letter[4:]
-            cover_letter = cover_letter.strip()
-        
-        return cover_letter
     
-    except Exception as e:
-        print(f"Error generating cover letter: {e}")
-        return f"Error generating cover letter: {str(e)}"
+    return "COVER_LETTER", prompt, COVER_LETTER_GENERATION_CONFIG
+
+
+def _parse_cover_letter_response(raw_response_text: str) -> str:
+    """Clean up a raw cover letter response."""
+    cover_letter = raw_response_text.strip()
+    
+    cover_letter = _strip_fences(cover_letter)
+    
+    return cover_letter
 
 
 def generate_application_email(
@@ -585,7 +1331,8 @@ def generate_application_email(
     role: str,
     company: str,
     resume_attached: bool = True,
-    cover_letter: Optional[str] = None
+    cover_letter: Optional[str] = None,
+    service_tier: Optional[str] = SERVICE_TIER_FLEX
 ) -> Dict[str, str]:
     """
     Generate a professional job application email.
@@ -596,112 +1343,94 @@ def generate_application_email(
         company: Company name
         resume_attached: Whether resume is attached
         cover_letter: Optional cover letter text
+        service_tier: Gemini service tier ('flex' by default)
     
     Returns:
         Dictionary with 'subject' and 'body' keys
     """
-    if not is_ai_available():
+    if not _AI_READY:
         return {
             "subject": f"Application for {role} Position",
             "body": "AI service not available. Please configure GEMINI_API_KEY."
         }
     
     try:
-        model = genai.GenerativeModel('models/gemini-1.5-pro')
-        
-        cover_letter_note = f"\nCover letter: {'Included' if cover_letter else 'Not included'}"
-        if cover_letter:
-            cover_letter_note += f"\nCover letter preview: {cover_letter[:200]}..."
-        
-        prompt = f"""Generate a professional job application email.
-
-CANDIDATE NAME: {candidate_name}
-ROLE: {role}
-COMPANY: {company}
-RESUME ATTACHED: {'Yes' if resume_attached else 'No'}{cover_letter_note}
-
-INSTRUCTIONS:
-1. Generate an email subject line (concise, professional)
-2. Generate an email body (concise, professional)
-3. Suitable for cold outreach or referral submission
-4. No emojis
-5. No excessive formality
-6. Clear call-to-action
-7. Professional but approachable tone
-8. Mention the role and company
-9. Reference attached resume if applicable
-
-OUTPUT FORMAT (JSON only):
-{{
-  "subject": "Email subject line",
-  "body": "Email body text"
-}}
-
-Return ONLY valid JSON, no markdown, no explanations.
-"""
-        
-        response = model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.6,
-                max_output_tokens=400,
-            )
+        _, prompt, generation_config = _build_prompt_application_email(
+            candidate_name, role, company, resume_attached, cover_letter
         )
         
-        # Log raw response before any processing
-        raw_response_text = response.text if hasattr(response, 'text') else str(response)
-        print(f"[INFO] Raw Gemini response (APPLICATION_EMAIL):")
-        print(f"[RAW_RESPONSE] {raw_response_text}")
-        print(f"[INFO] Raw response length: {len(raw_response_text)} chars")
-        
-        response_text = raw_response_text.strip()
-        log_prompt_and_response(prompt, response_text, "APPLICATION_EMAIL")
-        
-        # Parse JSON
-        if response_text.startswith('```'):
-            response_text = response_text.split('```')[1]
-            if response_text.startswith('json'):
-                response_text = response_text[4:]
-            response_text = response_text.strip()
-        elif response_text.startswith('```json'):
-            response_text = response_text[7:].strip()
-            if response_text.endswith('```'):
-                response_text = response_text[:-3].strip()
-        
-        try:
-            email_data = json.loads(response_text)
-        except json.JSONDecodeError:
-            json_match = re.search(r'\{[^{}]*\}', response_text, re.DOTALL)
-            if json_match:
-                email_data = json.loads(json_match.group(0))
-            else:
-                raise ValueError("Could not parse JSON from Gemini response")
+        raw_response_text = _cached_generate(
+            "APPLICATION_EMAIL", _MODEL_MAP['APPLICATION_EMAIL'], prompt, generation_config, service_tier,
+            validate=lambda text: _parse_application_email_response(text, role)
+        )
         
-        return {
-            "subject": str(email_data.get("subject", f"Application for {role} Position")).strip(),
-            "body": str(email_data.get("body", "")).strip()
-        }
+        log_prompt_and_response(prompt, raw_response_text.strip(), "APPLICATION_EMAIL")
+        return _parse_application_email_response(raw_response_text, role)
     
     except Exception as e:
-        print(f"Error generating application email: {e}")
+        logger.error("Error generating application email: %s", e)
         return {
             "subject": f"Application for {role} Position",
             "body": f"Dear Hiring Manager,\n\nI am writing to express my interest in the {role} position at {company}.\n\nPlease find my resume attached.\n\nBest regards,\n{candidate_name}"
         }
 
 
-def match_jd_cv(job_description: str, about_me: Dict[str, Any]) -> Dict[str, Any]:
+def _build_prompt_application_email(
+    candidate_name: str,
+    role: str,
+    company: str,
+    resume_attached: bool = True,
+    cover_letter: Optional[str] = None
+) -> Tuple[str, str, Dict[str, Any]]:
+    """Build the (feature, prompt, generation_config) triple for application email generation."""
+    cover_letter_note = f"\nCover letter: {'Included' if cover_letter else 'Not included'}"
+    if cover_letter:
+        cover_letter_note += f"\nCover letter preview: {cover_letter[:200]}..."
+    
+    prompt = f"""Write a job application email (subject and body) suitable for cold outreach or a
+referral submission. Mention the role and company, and reference the attached resume if applicable.
+
+CANDIDATE NAME: {candidate_name}
+ROLE: {role}
+COMPANY: {company}
+RESUME ATTACHED: {'Yes' if resume_attached else 'No'}{cover_letter_note}
+"""
+    
+    return "APPLICATION_EMAIL", prompt, APPLICATION_EMAIL_GENERATION_CONFIG
+
+
+def _parse_application_email_response(raw_response_text: str, role: str) -> Dict[str, str]:
+    """
+    Parse a raw application email response into 'subject' and 'body'.
+    Raises ValueError if the response is not valid JSON matching EmailSchema.
+    """
+    email_data = _parse_llm_json(raw_response_text)
+    _check_schema(email_data, EmailSchema)
+    
+    return {
+        "subject": str(email_data.get("subject", f"Application for {role} Position")).strip(),
+        "body": str(email_data.get("body", "")).strip()
+    }
+
+
+def match_jd_cv(job_description: str, about_me: Dict[str, Any], service_tier: Optional[str] = SERVICE_TIER_FLEX) -> Dict[str, Any]:
     """
     Analyze JD-CV match and return scoring.
     
     Args:
         job_description: Job description text
         about_me: Structured profile data from database
+        service_tier: Gemini service tier ('flex' by default)
     
     Returns:
         Dictionary with match_score, matched_skills, missing_skills, summary
     """
-    if not is_ai_available():
+    return _run(match_jd_cv_async(job_description, about_me, service_tier))
+
+
+async def match_jd_cv_async(job_description: str, about_me: Dict[str, Any], service_tier: Optional[str] = SERVICE_TIER_FLEX) -> Dict[str, Any]:
+    """Async version of match_jd_cv, for fanning out several matches with asyncio.gather."""
+    if not _AI_READY:
         return {
             "match_score": 0,
             "matched_skills": [],
@@ -710,119 +1439,209 @@ def match_jd_cv(job_description: str, about_me: Dict[str, Any]) -> Dict[str, Any
         }
     
     try:
-        model = genai.GenerativeModel('models/gemini-1.5-pro')
-        
-        # Prepare candidate profile
-        candidate_skills = about_me.get('skills', [])
-        if isinstance(candidate_skills, str):
-            candidate_skills = [s.strip() for s in candidate_skills.split(',') if s.strip()]
+        _, prompt, generation_config = await asyncio.to_thread(_build_prompt_match, job_description, about_me)
         
-        candidate_profile = f"""
-Name: {about_me.get('name', 'N/A')}
-Target Role: {about_me.get('looking_for', 'N/A')}
-Professional Summary: {about_me.get('bio', 'N/A')}
-Skills: {', '.join(candidate_skills) if candidate_skills else 'N/A'}
-Experience: {about_me.get('experience_summary', about_me.get('experience', 'N/A'))}
-"""
+        raw_response_text = await _cached_generate_async(
+            "JD_CV_MATCHING", _MODEL_MAP['JD_CV_MATCHING'], prompt, generation_config, service_tier,
+            validate=_parse_match_response
+        )
         
-        prompt = f"""Analyze the match between a job description and a candidate's profile.
+        log_prompt_and_response(prompt, raw_response_text.strip(), "JD_CV_MATCHING")
+        return _parse_match_response(raw_response_text)
+    
+    except Exception as e:
+        logger.error("Error in JD-CV matching: %s", e)
+        return {
+            "match_score": 0,
+            "matched_skills": [],
+            "missing_skills": [],
+            "summary": f"Error analyzing match: {str(e)}"
+        }
+
+
+def batch_match_jd_cv(job_descriptions: List[str], about_me: Dict[str, Any], service_tier: Optional[str] = SERVICE_TIER_FLEX) -> List[Dict[str, Any]]:
+    """
+    Match one profile against several job descriptions with concurrent requests
+    (one prompt per job; see match_jd_cv_multi for packing jobs into one prompt).
+    Returns one match dictionary per job description, in input order.
+    """
+    async def gather_matches():
+        return await asyncio.gather(*(match_jd_cv_async(jd, about_me, service_tier) for jd in job_descriptions))
+    
+    return list(_run(gather_matches()))
+
+
+def _build_prompt_match(job_description: str, about_me: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+    """Build the (feature, prompt, generation_config) triple for JD-CV matching."""
+    candidate_profile = render_profile_card(about_me)
+    
+    prompt = f"""Score how well this candidate matches the job description.
+- match_score: integer 0-100 weighted by skills alignment (40%), experience relevance (30%),
+  role fit (20%) and overall compatibility (10%)
+- matched_skills: skills that appear in both the JD and the candidate profile
+- missing_skills: important JD skills the candidate lacks
+- summary: 2-3 sentences on the match quality
 
 JOB DESCRIPTION:
-{job_description[:2000]}
+{_truncate_to_tokens(job_description, JD_TOKEN_BUDGET)}
 
 CANDIDATE PROFILE:
 {candidate_profile}
-
-TASK:
-1. Analyze relevance and compatibility
-2. Match skills mentioned in JD with candidate's skills
-3. Identify missing skills that the JD requires
-4. Calculate a match score (0-100) based on:
-   - Skills alignment (40%)
-   - Experience relevance (30%)
-   - Role fit (20%)
-   - Overall compatibility (10%)
-5. Provide a brief summary (2-3 sentences)
-
-OUTPUT FORMAT (JSON only):
-{{
-  "match_score": 0-100,
-  "matched_skills": ["skill1", "skill2", ...],
-  "missing_skills": ["skill1", "skill2", ...],
-  "summary": "Brief summary of the match"
-}}
-
-CRITICAL RULES:
-1. Return ONLY valid JSON, no markdown, no code blocks
-2. match_score must be an integer between 0 and 100
-3. matched_skills: array of skills that appear in both JD and candidate profile
-4. missing_skills: array of important skills from JD that candidate lacks
-5. summary: 2-3 sentences explaining the match quality
-6. Be honest and accurate - don't inflate scores
 """
+    
+    return "JD_CV_MATCHING", prompt, JD_CV_MATCHING_GENERATION_CONFIG
+
+
+def _parse_match_response(raw_response_text: str) -> Dict[str, Any]:
+    """
+    Parse and validate a raw JD-CV matching response.
+    Raises ValueError if the response is not valid JSON matching MatchSchema.
+    """
+    match_data = _parse_llm_json(raw_response_text)
+    _check_schema(match_data, MatchSchema)
+    return _normalize_match(match_data)
+
+
+def _clean_skills(skills: List[Any]) -> List[str]:
+    """Drop empty entries and strip the rest (map/filter keep the loop in C)."""
+    return list(map(str.strip, map(str, filter(None, skills))))
+
+
+def _normalize_match(match_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Clamp the score and clean up skill lists of one match result."""
+    match_score = int(match_data.get("match_score", 0))
+    match_score = 0 if match_score < 0 else 100 if match_score > 100 else match_score  # Clamp between 0-100
+    
+    matched_skills = match_data.get("matched_skills", [])
+    if not isinstance(matched_skills, list):
+        matched_skills = []
+    
+    missing_skills = match_data.get("missing_skills", [])
+    if not isinstance(missing_skills, list):
+        missing_skills = []
+    
+    return {
+        "match_score": match_score,
+        "matched_skills": _clean_skills(matched_skills),
+        "missing_skills": _clean_skills(missing_skills),
+        "summary": str(match_data.get("summary", "")).strip()
+    }
+
+
+def match_jd_cv_multi(jds: List[Dict[str, Any]], about_me: Dict[str, Any], service_tier: Optional[str] = SERVICE_TIER_FLEX) -> List[Dict[str, Any]]:
+    """
+    Score one profile against many job descriptions, several jobs per prompt.
+    
+    Args:
+        jds: List of dicts with 'description' and optionally 'title'
+        about_me: Structured profile data from database
+        service_tier: Gemini service tier ('flex' by default)
+    
+    Returns:
+        One match dictionary (as returned by match_jd_cv) per job, in input order
+    """
+    if len(jds) == 1:
+        return [match_jd_cv(jds[0].get('description', ''), about_me, service_tier)]
+    
+    if not _AI_READY:
+        return [
+            {
+                "match_score": 0,
+                "matched_skills": [],
+                "missing_skills": [],
+                "summary": "AI service not available for matching."
+            }
+            for _ in jds
+        ]
+    
+    return _run(match_jd_cv_multi_async(jds, about_me, service_tier))
+
+
+async def match_jd_cv_multi_async(jds: List[Dict[str, Any]], about_me: Dict[str, Any], service_tier: Optional[str] = SERVICE_TIER_FLEX) -> List[Dict[str, Any]]:
+    """Async version of match_jd_cv_multi; chunks are scored concurrently."""
+    chunks = [jds[i:i + MULTI_MATCH_CHUNK_SIZE] for i in range(0, len(jds), MULTI_MATCH_CHUNK_SIZE)]
+    results = await asyncio.gather(*(_match_jd_chunk(chunk, about_me, service_tier) for chunk in chunks))
+    return [match for chunk_result in results for match in chunk_result]
+
+
+async def _match_jd_chunk(jds: List[Dict[str, Any]], about_me: Dict[str, Any], service_tier: Optional[str]) -> List[Dict[str, Any]]:
+    """Score one chunk of jobs with a single prompt."""
+    try:
+        prompt, generation_config = await asyncio.to_thread(_build_prompt_match_multi, jds, about_me)
         
-        response = model.generate_content(
-            prompt,
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.2,  # Low temperature for analytical task
-                max_output_tokens=500,
-            )
+        raw_response_text = await _cached_generate_async(
+            "JD_CV_MULTI_MATCHING", _MODEL_MAP['JD_CV_MATCHING'], prompt, generation_config, service_tier,
+            validate=lambda text: _parse_multi_match_response(text, len(jds), strict=True)
         )
         
-        # Log raw response before any processing
-        raw_response_text = response.text if hasattr(response, 'text') else str(response)
-        print(f"[INFO] Raw Gemini response (JD_CV_MATCHING):")
-        print(f"[RAW_RESPONSE] {raw_response_text}")
-        print(f"[INFO] Raw response length: {len(raw_response_text)} chars")
-        
-        response_text = raw_response_text.strip()
-        log_prompt_and_response(prompt, response_text, "JD_CV_MATCHING")
-        
-        # Parse JSON
-        if response_text.startswith('```'):
-            response_text = response_text.split('```')[1]
-            if response_text.startswith('json'):
-                response_text = response_text[4:]
-            response_text = response_text.strip()
-        elif response_text.startswith('```json'):
-            response_text = response_text[7:].strip()
-            if response_text.endswith('```'):
-                response_text = response_text[:-3].strip()
-        
-        try:
-            match_data = json.loads(response_text)
-        except json.JSONDecodeError:
-            json_match = re.search(r'\{[^{}]*\}', response_text, re.DOTALL)
-            if json_match:
-                match_data = json.loads(json_match.group(0))
-            else:
-                raise ValueError("Could not parse JSON from Gemini response")
-        
-        # Validate and normalize
-        match_score = int(match_data.get("match_score", 0))
-        match_score = max(0, min(100, match_score))  # Clamp between 0-100
-        
-        matched_skills = match_data.get("matched_skills", [])
-        if not isinstance(matched_skills, list):
-            matched_skills = []
-        
-        missing_skills = match_data.get("missing_skills", [])
-        if not isinstance(missing_skills, list):
-            missing_skills = []
-        
-        return {
-            "match_score": match_score,
-            "matched_skills": [str(s).strip() for s in matched_skills if s],
-            "missing_skills": [str(s).strip() for s in missing_skills if s],
-            "summary": str(match_data.get("summary", "")).strip()
-        }
+        log_prompt_and_response(prompt, raw_response_text.strip(), "JD_CV_MULTI_MATCHING")
+        return _parse_multi_match_response(raw_response_text, len(jds))
     
     except Exception as e:
-        print(f"Error in JD-CV matching: {e}")
-        return {
+        logger.error("Error in multi JD-CV matching: %s", e)
+        return [
+            {
+                "match_score": 0,
+                "matched_skills": [],
+                "missing_skills": [],
+                "summary": f"Error analyzing match: {str(e)}"
+            }
+            for _ in jds
+        ]
+
+
+def _build_prompt_match_multi(jds: List[Dict[str, Any]], about_me: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """Build the prompt and generation config scoring several jobs against one profile."""
+    jobs_text = "\n\n".join(
+        f"[{index}] {jd.get('title') or 'Untitled role'}\n{_truncate_to_tokens(jd.get('description') or '', JD_TOKEN_BUDGET)}"
+        for index, jd in enumerate(jds, 1)
+    )
+    
+    prompt = f"""Score how well this candidate matches each job below. Return one result per job,
+with job_index set to the job's number in brackets.
+- match_score: integer 0-100 weighted by skills alignment (40%), experience relevance (30%),
+  role fit (20%) and overall compatibility (10%)
+- matched_skills: skills that appear in both the JD and the candidate profile
+- missing_skills: important JD skills the candidate lacks
+- summary: 2-3 sentences on the match quality
+
+CANDIDATE PROFILE:
+{render_profile_card(about_me)}
+
+JOBS:
+{jobs_text}
+"""
+    
+    generation_config = _array_generation_config(
+        JD_CV_MATCHING_GENERATION_CONFIG, IndexedMatchSchema, len(jds), MULTI_MATCH_TOKENS_PER_JOB
+    )
+    return prompt, generation_config
+
+
+def _parse_multi_match_response(raw_response_text: str, job_count: int, strict: bool = False) -> List[Dict[str, Any]]:
+    """
+    Map a multi-job match response back to input order by job_index.
+    Jobs missing from the response get an error result, or raise when strict.
+    """
+    match_list = _parse_llm_json(raw_response_text)
+    _check_schema(match_list, List[IndexedMatchSchema])
+    
+    by_index = {}
+    for match_data in match_list:
+        index = int(match_data["job_index"])
+        if 1 <= index <= job_count:
+            by_index[index] = _normalize_match(match_data)
+    
+    missing = [index for index in range(1, job_count + 1) if index not in by_index]
+    if missing and strict:
+        raise ValueError(f"Response is missing job_index {missing}")
+    
+    return [
+        by_index.get(index, {
             "match_score": 0,
             "matched_skills": [],
             "missing_skills": [],
-            "summary": f"Error analyzing match: {str(e)}"
-        }
-
+            "summary": "Error analyzing match: job missing from response"
+        })
+        for index in range(1, job_count + 1)
+    ]
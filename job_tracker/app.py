@@ -3,9 +3,13 @@ from __future__ import annotations
 import os
 import re
 import json
-from datetime import date, datetime, timedelta
-from functools import wraps
-from urllib.parse import quote, urlparse
+import threading
+import time as _time
+from collections import OrderedDict, defaultdict, namedtuple
+from datetime import date, datetime, time, timedelta
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from urllib.parse import quote, urlencode, urlparse
 
 # Load environment variables from .env file if it exists
 try:
@@ -16,7 +20,8 @@ except ImportError:
     pass
 
 import mysql.connector
-from flask import Flask, flash, jsonify, redirect, render_template, request, session, url_for, send_from_directory
+import mysql.connector.pooling
+from flask import Flask, flash, g, has_request_context, jsonify, redirect, render_template, request, session, url_for, send_from_directory
 from werkzeug.exceptions import NotFound
 from werkzeug.security import check_password_hash, generate_password_hash
 from werkzeug.utils import secure_filename
@@ -34,6 +39,19 @@ try:
 except ImportError:
     DOCX_AVAILABLE = False
 
+# Password hashing: argon2 when installed, Werkzeug's PBKDF2 otherwise
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+    _PH = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
+    ARGON2_AVAILABLE = True
+except ImportError:
+    _PH = None
+    ARGON2_AVAILABLE = False
+
+# Pinned PBKDF2 parameters for the Werkzeug fallback
+_HASH_METHOD = "pbkdf2:sha256:260000"
+
 # Import AI service module
 try:
     from ai_service import (
@@ -41,7 +59,8 @@ try:
         extract_cv_data_deep,
         generate_cover_letter,
         generate_application_email,
-        match_jd_cv
+        match_jd_cv,
+        get_ai_trace
     )
     AI_SERVICE_AVAILABLE = True
 except ImportError:
@@ -57,6 +76,8 @@ except ImportError:
         return {"subject": "", "body": ""}
     def match_jd_cv(*args, **kwargs):
         return {"match_score": 0, "matched_skills": [], "missing_skills": [], "summary": ""}
+    def get_ai_trace(limit=100):
+        return []
 
 app = Flask(__name__)
 app.secret_key = "change-me"  # needed for flash messages
@@ -87,54 +108,271 @@ DB_CONFIG = {
 }
 
 
-ALLOWED_STATUSES = ["Applied", "Interview", "Rejected", "Offer"]
-ALLOWED_DIFFICULTIES = ["Easy", "Medium", "Hard"]
+# Ordered tuples for rendering; frozensets for membership checks
+ALLOWED_STATUSES_ORDER = ("Applied", "Interview", "Rejected", "Offer")
+ALLOWED_STATUSES = frozenset(ALLOWED_STATUSES_ORDER)
+ALLOWED_DIFFICULTIES_ORDER = ("Easy", "Medium", "Hard")
+ALLOWED_DIFFICULTIES = frozenset(ALLOWED_DIFFICULTIES_ORDER)
 
+# Dashboard job list paging (?page=&page_size=)
+JOBS_PAGE_SIZE = 50
+JOBS_MAX_PAGE_SIZE = 200
+
+# Upcoming interviews within this window are highlighted as "soon"
+SOON_WINDOW = timedelta(days=3)
+
+STATUS_BADGE = {
+    "Applied": "secondary",
+    "Interview": "info",
+    "Rejected": "danger",
+    "Offer": "success",
+}
 
-_INTERVIEWS_COLUMNS: set[str] | None = None
 
+# Bump when ensure_schema() gains a new migration step
+CURRENT_SCHEMA_VERSION = 3
 
-def get_interviews_columns() -> set[str]:
+# Named MySQL lock held by the worker running ensure_schema() migrations
+SCHEMA_LOCK_NAME = "jt_schema"
+SCHEMA_LOCK_TIMEOUT = 60  # seconds other workers wait for it
+
+_DB_NAME = DB_CONFIG["database"]
+
+_COLS_SQL = """
+SELECT COLUMN_NAME
+FROM INFORMATION_SCHEMA.COLUMNS
+WHERE TABLE_SCHEMA = %s
+  AND TABLE_NAME = 'interviews'
+"""
+
+_INTERVIEWS_COLUMNS: set[str] | None = None
+_VENUE_EXPR: str | None = None
+_COMPLETE_INTERVIEW_SQL: str | None = None
+_interviews_columns_lock = threading.Lock()
+
+
+# Hot-path statements, built once at import. {venue_expr} is filled by venue_sql().
+# interview_time comes back as an ISO "HH:MM:SS" string (literal % doubled for the driver).
+# CRITICAL: every query filters by user_id (and the joins on both tables) for security.
+FETCH_JOB_SQL = """
+SELECT
+  j.id, j.company, j.role, j.location, j.job_link, j.status, j.applied_date, j.notes,
+  i.interview_date, TIME_FORMAT(i.interview_time, '%%H:%%i:%%S') AS interview_time,
+  {venue_expr} AS interview_venue, i.interview_completed,
+  i.interview_difficulty, i.interview_experience_notes, j.user_id
+FROM jobs j
+LEFT JOIN interviews i ON i.job_id = j.id AND i.user_id = j.user_id
+WHERE j.id = %s AND j.user_id = %s
+"""
+
+# Dashboard list; {filters} is filled by index_jobs_sql() from the active filters.
+# The LEFT JOIN also matches user_id to prevent cross-user data leaks.
+INDEX_JOBS_SQL = """
+SELECT
+  j.id, j.company, j.role, j.location, j.job_link, j.status, j.applied_date, j.notes,
+  i.interview_date, i.interview_time, {venue_expr} AS interview_venue, i.interview_completed,
+  i.interview_difficulty, i.interview_experience_notes,
+  DATEDIFF(CURDATE(), j.applied_date) AS days_ago,
+  -- Auto status reminder: Applied for 3+ days => show follow-up reminder
+  (j.status = 'Applied' AND DATEDIFF(CURDATE(), j.applied_date) >= 3) AS follow_up_reminder,
+  -- Interview status without details yet => show a gentle prompt
+  (j.status = 'Interview' AND i.interview_date IS NULL) AS needs_interview_details
+FROM jobs j
+LEFT JOIN interviews i ON i.job_id = j.id AND i.user_id = j.user_id
+WHERE j.user_id = %s{filters}
+ORDER BY j.applied_date DESC, j.id DESC
+LIMIT %s OFFSET %s
+"""
+
+# Jobs needing follow-up reminders (status="Applied" AND applied_date older than 3 days)
+FOLLOW_UP_REMINDERS_SQL = """
+SELECT
+  j.id, j.company, j.role, j.location, j.job_link, j.status, j.applied_date, j.notes,
+  DATEDIFF(CURDATE(), j.applied_date) AS days_ago
+FROM jobs j
+WHERE j.status = 'Applied'
+  AND j.applied_date < DATE_SUB(CURDATE(), INTERVAL 3 DAY)
+  AND j.user_id = %s
+ORDER BY j.applied_date ASC
+"""
+
+INSERT_JOB_SQL = """
+INSERT INTO jobs (user_id, company, role, location, job_link, status, applied_date, notes)
+VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+UPDATE_JOB_SQL = """
+UPDATE jobs
+SET company=%s, role=%s, location=%s, job_link=%s, status=%s, applied_date=%s, notes=%s
+WHERE id=%s AND user_id=%s
+"""
+
+# Upcoming and past interviews in one pass, ordered oldest first;
+# interviews() splits them on is_upcoming and reverses the past ones
+INTERVIEWS_SQL = """
+SELECT
+  i.job_id AS id,
+  i.company_tag AS company,
+  i.role_tag AS role,
+  i.interview_date, TIME_FORMAT(i.interview_time, '%%H:%%i:%%S') AS interview_time,
+  {venue_expr} AS interview_venue,
+  i.interview_completed, i.interview_difficulty, i.interview_experience_notes,
+  i.interview_completed = 0 AND i.interview_date >= CURDATE() AS is_upcoming,
+  i.interview_date = CURDATE() AS is_today,
+  i.interview_date BETWEEN CURDATE() AND DATE_ADD(CURDATE(), INTERVAL %s DAY) AS is_soon,
+  i.interview_completed = 0 AND i.interview_date < CURDATE() AS is_missed
+FROM interviews i
+JOIN jobs j ON j.id = i.job_id AND j.user_id = i.user_id
+WHERE j.status='Interview'
+  AND (i.interview_completed=1 OR i.interview_date IS NOT NULL)
+  AND i.user_id = %s
+  AND j.user_id = %s
+ORDER BY i.interview_date ASC, i.interview_time ASC
+"""
+
+
+def get_interviews_columns(conn=None) -> set[str]:
     """
     Cached lookup of interviews table columns.
     This lets us support legacy schemas (some DBs have a required `venue` column).
+    Normally pre-populated by ensure_schema(); pass an open connection to reuse it
+    on a cold cache (it is left open).
     """
     global _INTERVIEWS_COLUMNS
     if _INTERVIEWS_COLUMNS is not None:
         return _INTERVIEWS_COLUMNS
 
-    conn = None
-    cursor = None
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT COLUMN_NAME
-            FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = %s
-              AND TABLE_NAME = 'interviews'
-            """,
-            (DB_CONFIG["database"],),
-        )
-        _INTERVIEWS_COLUMNS = {r[0] for r in (cursor.fetchall() or [])}
-        return _INTERVIEWS_COLUMNS
-    except mysql.connector.Error:
-        _INTERVIEWS_COLUMNS = set()
-        return _INTERVIEWS_COLUMNS
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
+    # Only one thread runs the lookup on a cold cache; the rest wait and reuse it
+    with _interviews_columns_lock:
+        if _INTERVIEWS_COLUMNS is not None:
+            return _INTERVIEWS_COLUMNS
+
+        own_conn = conn is None
+        cursor = None
+        try:
+            if own_conn:
+                conn = get_connection()
+            cursor = conn.cursor()
+            cursor.execute(_COLS_SQL, (_DB_NAME,))
+            _INTERVIEWS_COLUMNS = {r[0] for r in cursor}
+            return _INTERVIEWS_COLUMNS
+        except mysql.connector.Error:
+            _INTERVIEWS_COLUMNS = set()
+            return _INTERVIEWS_COLUMNS
+        finally:
+            if cursor is not None:
+                cursor.close()
+            if own_conn and conn is not None:
+                conn.close()
+
+
+def get_venue_expr(conn=None) -> str:
+    """
+    SQL expression for an interview's venue (alias `i`), cached with the columns.
+    Legacy schemas store it in `venue` instead of (or as well as) `interview_venue`.
+    """
+    global _VENUE_EXPR
+    if _VENUE_EXPR is not None:
+        return _VENUE_EXPR
+
+    interviews_cols = get_interviews_columns(conn)
+    if "venue" in interviews_cols and "interview_venue" in interviews_cols:
+        _VENUE_EXPR = "COALESCE(i.interview_venue, i.venue)"
+    elif "venue" in interviews_cols:
+        _VENUE_EXPR = "i.venue"
+    else:
+        _VENUE_EXPR = "i.interview_venue"
+    return _VENUE_EXPR
+
+
+def interview_venue_columns(interviews_cols: set[str]) -> list[str]:
+    """
+    Columns an interview's venue is written to.
+    Legacy schemas have a required `venue` column; fill it and interview_venue
+    (when present) in the same row instead of a follow-up UPDATE.
+    """
+    venue_columns = ["venue"] if "venue" in interviews_cols else []
+    if "interview_venue" in interviews_cols or not venue_columns:
+        venue_columns.append("interview_venue")
+    return venue_columns
+
+
+def get_complete_interview_sql(conn=None) -> str:
+    """
+    UPDATE that marks an interview completed, cached with the columns.
+    Legacy `status` / `experience` columns are set in the same statement; MySQL
+    assigns left to right, so `experience` picks up the new notes.
+    """
+    global _COMPLETE_INTERVIEW_SQL
+    if _COMPLETE_INTERVIEW_SQL is not None:
+        return _COMPLETE_INTERVIEW_SQL
+
+    interviews_cols = get_interviews_columns(conn)
+    legacy_sets = ""
+    if "status" in interviews_cols:
+        legacy_sets += ",\n    status='Completed'"
+    if "experience" in interviews_cols:
+        legacy_sets += ",\n    experience=interview_experience_notes"
+    _COMPLETE_INTERVIEW_SQL = f"""
+UPDATE interviews
+SET interview_completed=1,
+    interview_difficulty=%s,
+    interview_experience_notes=%s{legacy_sets}
+WHERE job_id=%s AND user_id=%s
+"""
+    return _COMPLETE_INTERVIEW_SQL
+
+
+@lru_cache(maxsize=None)
+def _format_index_jobs_sql(filter_company: bool, filter_status: bool, venue_expr: str) -> str:
+    filters = ""
+    if filter_company:
+        filters += " AND j.company LIKE %s"
+    if filter_status:
+        filters += " AND j.status = %s"
+    return INDEX_JOBS_SQL.format(venue_expr=venue_expr, filters=filters)
+
+
+def index_jobs_sql(filter_company: bool, filter_status: bool, conn=None) -> str:
+    """Dashboard query for the given filter combination; built once per combination."""
+    return _format_index_jobs_sql(filter_company, filter_status, get_venue_expr(conn))
+
+
+@lru_cache(maxsize=None)
+def _format_venue_sql(template: str, venue_expr: str) -> str:
+    return template.format(venue_expr=venue_expr)
+
+
+def venue_sql(template: str, conn=None) -> str:
+    """Fill {venue_expr} in a module-level SQL template; built once per template."""
+    return _format_venue_sql(template, get_venue_expr(conn))
+
+
+@lru_cache(maxsize=None)
+def _row_type(fields: tuple[str, ...]):
+    return namedtuple("Row", fields)
 
 
+def rows_as_namedtuples(cursor) -> list:
+    """Fetch the remaining rows as namedtuples named after cursor.column_names."""
+    row_type = _row_type(tuple(cursor.column_names))
+    return [row_type._make(row) for row in cursor.fetchall()]
+
+
+_URL_LEADING_JUNK = "".join(map(chr, range(0x21)))
+
+
+@lru_cache(maxsize=2048)
 def is_valid_job_link(url: str) -> bool:
     """
     Very simple URL validation:
     - must be http(s)
     - must have a hostname
     """
+    # Cheap reject before parsing; urlparse strips leading control/space characters
+    # and lowercases the scheme, so compare likewise
+    if not url.lstrip(_URL_LEADING_JUNK)[:8].lower().startswith(("http://", "https://")):
+        return False
     try:
         parsed = urlparse(url)
         return parsed.scheme in ("http", "https") and bool(parsed.netloc)
@@ -142,6 +380,32 @@ def is_valid_job_link(url: str) -> bool:
         return False
 
 
+def hash_password(password: str) -> str:
+    """Hash a password with argon2 when available, otherwise with Werkzeug."""
+    if ARGON2_AVAILABLE:
+        return _PH.hash(password)
+    return generate_password_hash(password, method=_HASH_METHOD, salt_length=16)
+
+
+def verify_password(password_hash: str, password: str) -> tuple[bool, bool]:
+    """
+    Check a password against a stored argon2 or Werkzeug hash.
+    Returns (matches, needs_rehash); needs_rehash is True when the password
+    matched a legacy PBKDF2 hash or outdated argon2 parameters.
+    """
+    if password_hash.startswith("$argon2"):
+        if not ARGON2_AVAILABLE:
+            return False, False
+        try:
+            _PH.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False, False
+        return True, _PH.check_needs_rehash(password_hash)
+
+    matches = check_password_hash(password_hash, password)
+    return matches, matches and ARGON2_AVAILABLE
+
+
 def allowed_file(filename: str) -> bool:
     """Check if file extension is allowed."""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -181,6 +445,18 @@ def extract_text_from_docx(file_path: str) -> str:
         return ""
 
 
+# Patterns for the pattern-matching CV parser, compiled once at import
+_CV_NAME_RES = (
+    re.compile(r'name[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', re.IGNORECASE),
+    re.compile(r'full\s+name[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)', re.IGNORECASE),
+)
+_CV_NAME_LINE_RE = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$')
+_CV_URL_RE = re.compile(r'https?://[^\s]+|www\.[^\s]+|github\.com/[^\s]+|linkedin\.com/[^\s]+', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+_BULLET_RE = re.compile(r'^[•\-\*\d+\.\)]\s*', re.MULTILINE)
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+
 def extract_cv_data(text: str) -> dict:
     """
     Extract structured data from CV text using pattern matching.
@@ -196,12 +472,8 @@ def extract_cv_data(text: str) -> dict:
     non_empty_lines = [line.strip() for line in lines if line.strip()]
     
     # Extract name (usually first line or after "Name:" or "Full Name:")
-    name_patterns = [
-        r'name[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-        r'full\s+name[:\s]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-    ]
-    for pattern in name_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _CV_NAME_RES:
+        match = pattern.search(text)
         if match:
             name_value = match.group(1).strip()
             if name_value:
@@ -211,7 +483,7 @@ def extract_cv_data(text: str) -> dict:
     if "name" not in data and non_empty_lines:
         # Try first line if it looks like a name
         first_line = non_empty_lines[0]
-        if re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)+$', first_line) and len(first_line.split()) <= 4:
+        if _CV_NAME_LINE_RE.match(first_line) and len(first_line.split()) <= 4:
             data["name"] = first_line
     
     # Extract skills (look for "Skills:", "Technical Skills:", etc.)
@@ -243,8 +515,7 @@ def extract_cv_data(text: str) -> dict:
             data["achievements"] = ach_text
     
     # Extract portfolio links (GitHub, LinkedIn, websites)
-    url_pattern = r'https?://[^\s]+|www\.[^\s]+|github\.com/[^\s]+|linkedin\.com/[^\s]+'
-    urls = re.findall(url_pattern, text, re.IGNORECASE)
+    urls = _CV_URL_RE.findall(text)
     if urls:
         portfolio_text = "\n".join(urls[:5])  # Limit to 5 links
         if portfolio_text:
@@ -294,11 +565,11 @@ def clean_section_text(text: str) -> str:
         return ""
     
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     # Remove bullet points and special characters at start of lines
-    text = re.sub(r'^[•\-\*\d+\.\)]\s*', '', text, flags=re.MULTILINE)
+    text = _BULLET_RE.sub('', text)
     # Remove email addresses (keep URLs)
-    text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '', text)
+    text = _EMAIL_RE.sub('', text)
     # Clean up
     text = text.strip()
     
@@ -307,6 +578,17 @@ def clean_section_text(text: str) -> str:
 
 # extract_cv_data_with_gemini moved to ai_service.py
 
+_CAL_BASE = "https://calendar.google.com/calendar/render?"
+_CAL_DEFAULT_DURATION = timedelta(hours=1)
+_CAL_TITLE = "Interview: {company} - {role}"
+_CAL_DESCRIPTION = "Job Application Interview\n\nCompany: {company}\nRole: {role}"
+
+
+def _gcal_fmt(dt: datetime) -> str:
+    """Format a datetime as YYYYMMDDTHHMMSS without strftime."""
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}T{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
+
+
 def generate_google_calendar_url(
     title: str,
     start_datetime: datetime,
@@ -329,11 +611,11 @@ def generate_google_calendar_url(
         Google Calendar URL string
     """
     if end_datetime is None:
-        end_datetime = start_datetime + timedelta(hours=1)
+        end_datetime = start_datetime + _CAL_DEFAULT_DURATION
     
     # Format dates for Google Calendar: YYYYMMDDTHHMMSS (local time, no timezone)
-    start_str = start_datetime.strftime("%Y%m%dT%H%M%S")
-    end_str = end_datetime.strftime("%Y%m%dT%H%M%S")
+    start_str = _gcal_fmt(start_datetime)
+    end_str = _gcal_fmt(end_datetime)
     
     # Build Google Calendar URL
     params = {
@@ -344,56 +626,205 @@ def generate_google_calendar_url(
         "location": location,
     }
     
-    # URL encode parameters
-    query_string = "&".join(f"{k}={quote(str(v))}" for k, v in params.items() if v)
+    # URL encode parameters (safe='/' keeps the dates range separator literal)
+    query_string = urlencode({k: v for k, v in params.items() if v}, safe="/", quote_via=quote)
     
-    return f"https://calendar.google.com/calendar/render?{query_string}"
+    return _CAL_BASE + query_string
+
+
+# On some Windows setups, mysql-connector's optional native extension can crash,
+# so the pure-Python implementation is the default there. Elsewhere the C extension
+# (used when installed) decodes result sets much faster. JTA_USE_PURE=1/0 overrides.
+DB_USE_PURE = os.environ.get("JTA_USE_PURE", "1" if os.name == "nt" else "0") == "1"
+# buffered=True: helpers share one connection per request, so a cursor must never
+# leave unread rows behind for the next helper.
+DB_CONNECT_ARGS = {**DB_CONFIG, "use_pure": DB_USE_PURE, "connection_timeout": 5, "buffered": True}
+DB_POOL_SIZE = 8
+
+# Connections are borrowed from a pool; conn.close() hands them back.
+# pool_reset_session resets each connection on return, so an open read
+# transaction never leaks a stale snapshot into the next request.
+_pool_lock = threading.Lock()
+
+
+def _create_pool():
+    try:
+        return mysql.connector.pooling.MySQLConnectionPool(
+            pool_name="jta",
+            pool_size=DB_POOL_SIZE,
+            pool_reset_session=True,
+            **DB_CONNECT_ARGS,
+        )
+    except mysql.connector.Error:
+        # Database not reachable (e.g. first boot); use direct connections for now
+        return None
+
+
+_POOL = _create_pool()
+
+
+def _open_connection():
+    global _POOL
+    if _POOL is None:
+        # The database was down at import; try again so we stop paying a
+        # handshake per request once it is back
+        with _pool_lock:
+            if _POOL is None:
+                _POOL = _create_pool()
+    if _POOL is not None:
+        try:
+            return _POOL.get_connection()
+        except mysql.connector.errors.PoolError:
+            # All pooled connections are checked out; don't fail the request
+            pass
+    return mysql.connector.connect(**DB_CONNECT_ARGS)
+
+
+class _RequestConnection:
+    """Connection shared for one request; close() is deferred to teardown."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        pass
 
 
 def get_connection():
-    # On some Windows setups, mysql-connector's optional native extension can crash.
-    # use_pure=True forces the pure-Python implementation (more stable, still beginner-friendly).
-    return mysql.connector.connect(**DB_CONFIG, use_pure=True, connection_timeout=5)
+    """
+    Connection for the current request, opened on first use and shared by every
+    helper the request calls. Outside a request a fresh connection is returned.
+    Callers close it either way; for the shared one that is a no-op.
+    """
+    if not has_request_context():
+        return _open_connection()
+    conn = g.get("db")
+    if conn is None:
+        conn = g.db = _RequestConnection(_open_connection())
+    return conn
 
 
-def claim_orphaned_records(user_id: int):
+@contextmanager
+def db_cursor(dictionary: bool = False):
     """
-    Claims orphaned records (jobs/interviews with NULL user_id) for the current user.
-    This helps migrate existing data to user-based isolation.
+    Yield (conn, cursor) on the request's connection; both are closed on exit.
+    If the block raises, the connection is rolled back first so a half-done
+    write is never committed by a later helper sharing the connection.
     """
-    conn = None
+    conn = get_connection()
     cursor = None
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # Claim orphaned jobs
-        cursor.execute("UPDATE jobs SET user_id=%s WHERE user_id IS NULL", (user_id,))
-        jobs_claimed = cursor.rowcount
-        
-        # Claim orphaned interviews (update based on job_id)
-        cursor.execute("""
-            UPDATE interviews i
-            JOIN jobs j ON j.id = i.job_id
-            SET i.user_id = j.user_id
-            WHERE i.user_id IS NULL AND j.user_id = %s
-        """, (user_id,))
-        interviews_claimed = cursor.rowcount
-        
-        conn.commit()
-        
-        if jobs_claimed > 0 or interviews_claimed > 0:
-            return jobs_claimed, interviews_claimed
-        return 0, 0
-    except mysql.connector.Error:
-        if conn is not None:
+        cursor = conn.cursor(dictionary=dictionary)
+        yield conn, cursor
+    except Exception:
+        try:
             conn.rollback()
-        return 0, 0
+        except mysql.connector.Error:
+            pass
+        raise
     finally:
         if cursor is not None:
             cursor.close()
-        if conn is not None:
-            conn.close()
+        conn.close()
+
+
+@app.teardown_request
+def close_request_connection(exc):
+    """Return the request's shared connection to the pool."""
+    conn = g.pop("db", None)
+    if conn is not None:
+        conn._conn.close()
+
+
+# Short-lived per-user cache for the dashboard and interviews listings
+# and for single jobs opened by fetch_job().
+# Keys come from user_cache_key(); every write to that user's jobs/interviews
+# calls invalidate_user_cache().
+#
+# The cache lives in one process, so invalidate_user_cache() only clears this
+# worker. To keep read-your-own-writes with several WSGI workers, keys also
+# carry a per-session generation that each write bumps: the redirect after a
+# save misses on every worker. Writes made from another browser/session can
+# still show up to LIST_CACHE_TTL seconds late on workers that did not see them.
+LIST_CACHE_TTL = 30  # seconds
+JOB_CACHE_TTL = 10  # seconds, for single jobs from fetch_job()
+LIST_CACHE_SIZE = 1024
+
+# key -> (value, created_at), least recently used first
+_list_cache: "OrderedDict[tuple, tuple[object, float]]" = OrderedDict()
+_list_cache_lock = threading.Lock()
+
+
+def user_cache_key(user_id: int, *parts) -> tuple:
+    """Cache key for user_id, including this session's write generation."""
+    generation = session.get("_cache_gen", 0) if has_request_context() else 0
+    return (user_id, generation, *parts)
+
+
+def list_cache_get(key: tuple, ttl: float = LIST_CACHE_TTL):
+    """Return the cached listing for key, or None on a miss or an entry older than ttl."""
+    with _list_cache_lock:
+        entry = _list_cache.get(key)
+        if entry is None:
+            return None
+        if _time.monotonic() - entry[1] > ttl:
+            del _list_cache[key]
+            return None
+        _list_cache.move_to_end(key)
+        return entry[0]
+
+
+def list_cache_put(key: tuple, value) -> None:
+    with _list_cache_lock:
+        _list_cache[key] = (value, _time.monotonic())
+        _list_cache.move_to_end(key)
+        if len(_list_cache) > LIST_CACHE_SIZE:
+            _list_cache.popitem(last=False)
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """
+    Drop every cached listing of this user in this worker, and move the
+    session to a new key generation so other workers miss as well.
+    """
+    with _list_cache_lock:
+        for key in [key for key in _list_cache if key[0] == user_id]:
+            del _list_cache[key]
+    if has_request_context() and session.get("user_id") == user_id:
+        session["_cache_gen"] = session.get("_cache_gen", 0) + 1
+
+
+def claim_orphaned_records(user_id: int):
+    """
+    Claims orphaned records (jobs/interviews with NULL user_id) for the current user.
+    This helps migrate existing data to user-based isolation.
+    """
+    try:
+        with db_cursor() as (conn, cursor):
+            # Claim orphaned jobs
+            cursor.execute("UPDATE jobs SET user_id=%s WHERE user_id IS NULL", (user_id,))
+            jobs_claimed = cursor.rowcount
+
+            # Claim orphaned interviews (update based on job_id)
+            cursor.execute("""
+                UPDATE interviews i
+                JOIN jobs j ON j.id = i.job_id
+                SET i.user_id = j.user_id
+                WHERE i.user_id IS NULL AND j.user_id = %s
+            """, (user_id,))
+            interviews_claimed = cursor.rowcount
+
+            conn.commit()
+    except mysql.connector.Error:
+        return 0, 0
+
+    if jobs_claimed > 0 or interviews_claimed > 0:
+        invalidate_user_cache(user_id)
+        return jobs_claimed, interviews_claimed
+    return 0, 0
 
 
 def validate_job_ownership(job_id: int, user_id: int) -> bool:
@@ -402,20 +833,12 @@ def validate_job_ownership(job_id: int, user_id: int) -> bool:
     Returns True if owned, False otherwise.
     SECURITY: This function MUST be called before any edit/delete operation.
     """
-    conn = None
-    cursor = None
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM jobs WHERE id=%s AND user_id=%s", (job_id, user_id))
-        return cursor.fetchone() is not None
+        with db_cursor() as (conn, cursor):
+            cursor.execute("SELECT id FROM jobs WHERE id=%s AND user_id=%s", (job_id, user_id))
+            return cursor.fetchone() is not None
     except mysql.connector.Error:
         return False
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
 
 
 def validate_interview_ownership(job_id: int, user_id: int) -> bool:
@@ -424,27 +847,22 @@ def validate_interview_ownership(job_id: int, user_id: int) -> bool:
     Returns True if owned, False otherwise.
     SECURITY: This function MUST be called before any edit/delete operation.
     """
-    conn = None
-    cursor = None
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT id FROM interviews WHERE job_id=%s AND user_id=%s", (job_id, user_id))
-        return cursor.fetchone() is not None
+        with db_cursor() as (conn, cursor):
+            cursor.execute("SELECT id FROM interviews WHERE job_id=%s AND user_id=%s", (job_id, user_id))
+            return cursor.fetchone() is not None
     except mysql.connector.Error:
         return False
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
 
 
 def ensure_schema():
     """
     Creates (or migrates) the jobs table if needed.
     Assumes the database (job_tracker) already exists.
+    Also caches the interviews columns for get_interviews_columns().
+    Skipped once schema_version records CURRENT_SCHEMA_VERSION.
     """
+    global _INTERVIEWS_COLUMNS, _VENUE_EXPR, _COMPLETE_INTERVIEW_SQL
     create_jobs_table_sql = """
     CREATE TABLE IF NOT EXISTS jobs (
         id INT AUTO_INCREMENT PRIMARY KEY,
@@ -464,6 +882,10 @@ def ensure_schema():
         interview_completed TINYINT(1) NOT NULL DEFAULT 0,
         interview_difficulty VARCHAR(50) NULL,
         interview_experience_notes TEXT NULL,
+        INDEX ix_jobs_status_applied (status, applied_date),
+        INDEX ix_jobs_company (company),
+        INDEX ix_jobs_user_applied (user_id, applied_date),
+        INDEX ix_jobs_user_status (user_id, status, applied_date),
         CONSTRAINT fk_jobs_user FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
     );
     """
@@ -484,6 +906,8 @@ def ensure_schema():
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
         UNIQUE KEY uq_interviews_job (job_id),
+        INDEX ix_interviews_job_date (job_id, interview_date, interview_completed),
+        INDEX ix_interviews_user_date (user_id, interview_date, interview_time),
         CONSTRAINT fk_interviews_job FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
         CONSTRAINT fk_interviews_user FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
     );
@@ -535,105 +959,174 @@ def ensure_schema():
     );
     """
 
+    def schema_is_current() -> bool:
+        cursor.execute("SELECT MAX(v) FROM schema_version")
+        row = cursor.fetchone()
+        return bool(row and row[0] is not None and row[0] >= CURRENT_SCHEMA_VERSION)
+
     conn = None
     cursor = None
+    locked = False
     try:
         conn = get_connection()
         cursor = conn.cursor()
+        cursor.execute("CREATE TABLE IF NOT EXISTS schema_version (v INT PRIMARY KEY)")
+        if schema_is_current():
+            return
+
+        # Only one worker runs the DDL; the others wait for it and reuse its result
+        cursor.execute("SELECT GET_LOCK(%s, 0)", (SCHEMA_LOCK_NAME,))
+        locked = cursor.fetchone()[0] == 1
+        if not locked:
+            cursor.execute("SELECT GET_LOCK(%s, %s)", (SCHEMA_LOCK_NAME, SCHEMA_LOCK_TIMEOUT))
+            locked = cursor.fetchone()[0] == 1
+            if not locked:
+                # Never migrate without the lock; the caller retries on a later request
+                raise mysql.connector.Error(
+                    msg=f"Timed out after {SCHEMA_LOCK_TIMEOUT}s waiting for schema lock {SCHEMA_LOCK_NAME!r}"
+                )
+            if schema_is_current():
+                return
+
         cursor.execute(create_jobs_table_sql)
         cursor.execute(create_interviews_table_sql)
         cursor.execute(create_users_table_sql)
         cursor.execute(create_profiles_table_sql)
 
         # Migrations for existing tables (safe to run multiple times).
-        # If a column/index already exists, MySQL will raise an error we ignore.
-        alter_statements = [
-            "ALTER TABLE jobs ADD COLUMN user_id INT NULL",
-            "ALTER TABLE jobs ADD COLUMN interview_date DATE NULL",
-            "ALTER TABLE jobs ADD COLUMN interview_time TIME NULL",
-            "ALTER TABLE jobs ADD COLUMN interview_venue VARCHAR(255) NULL",
-            "ALTER TABLE jobs ADD COLUMN interview_completed TINYINT(1) NOT NULL DEFAULT 0",
-            "ALTER TABLE jobs ADD COLUMN interview_difficulty VARCHAR(50) NULL",
-            "ALTER TABLE jobs ADD COLUMN interview_experience_notes TEXT NULL",
-        ]
-        for stmt in alter_statements:
+        # INFORMATION_SCHEMA tells us up front which columns, indexes and
+        # foreign keys already exist, so only the missing ones are added.
+        cursor.execute(
+            """
+            SELECT TABLE_NAME, COLUMN_NAME, IS_NULLABLE
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = %s
+              AND TABLE_NAME IN ('jobs', 'interviews', 'users', 'profiles')
+            """,
+            (_DB_NAME,),
+        )
+        existing_columns = defaultdict(set)
+        nullable_columns = defaultdict(set)
+        for table_name, column_name, is_nullable in cursor:
+            existing_columns[table_name].add(column_name)
+            if is_nullable == "YES":
+                nullable_columns[table_name].add(column_name)
+
+        cursor.execute(
+            """
+            SELECT DISTINCT TABLE_NAME, INDEX_NAME
+            FROM INFORMATION_SCHEMA.STATISTICS
+            WHERE TABLE_SCHEMA = %s
+              AND TABLE_NAME IN ('jobs', 'interviews')
+            """,
+            (_DB_NAME,),
+        )
+        existing_indexes = defaultdict(set)
+        for table_name, index_name in cursor:
+            existing_indexes[table_name].add(index_name)
+
+        cursor.execute(
+            """
+            SELECT CONSTRAINT_NAME
+            FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS
+            WHERE TABLE_SCHEMA = %s
+              AND CONSTRAINT_TYPE = 'FOREIGN KEY'
+            """,
+            (_DB_NAME,),
+        )
+        existing_foreign_keys = {constraint_name for (constraint_name,) in cursor}
+
+        def add_missing_columns(table: str, columns: dict[str, str]) -> None:
+            # One multi-action ALTER so the table is rebuilt at most once
+            missing = [column for column in columns if column not in existing_columns[table]]
+            if missing:
+                actions = ", ".join(f"ADD COLUMN {column} {columns[column]}" for column in missing)
+                cursor.execute(f"ALTER TABLE {table} {actions}")
+                existing_columns[table].update(missing)
+                nullable_columns[table].update(column for column in missing if "NOT NULL" not in columns[column])
+
+        def make_user_id_required(table: str) -> None:
+            # Fails while NULL values remain, which is OK - they'll be claimed on next login
+            if "user_id" in nullable_columns[table]:
+                try:
+                    cursor.execute(f"ALTER TABLE {table} MODIFY COLUMN user_id INT NOT NULL")
+                    nullable_columns[table].discard("user_id")
+                except mysql.connector.Error:
+                    pass
+
+        def add_user_foreign_key(table: str, name: str) -> None:
+            if name not in existing_foreign_keys:
+                try:
+                    cursor.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE")
+                    existing_foreign_keys.add(name)
+                except mysql.connector.Error:
+                    # Rows pointing at deleted users block the constraint
+                    pass
+
+        add_missing_columns("jobs", {
+            "user_id": "INT NULL",
+            "interview_date": "DATE NULL",
+            "interview_time": "TIME NULL",
+            "interview_venue": "VARCHAR(255) NULL",
+            "interview_completed": "TINYINT(1) NOT NULL DEFAULT 0",
+            "interview_difficulty": "VARCHAR(50) NULL",
+            "interview_experience_notes": "TEXT NULL",
+        })
+        
+        # After adding user_id column, try to assign existing rows to first user
+        # (This is a one-time migration; ongoing orphaned records are handled on login).
+        # Data changes are committed together with the schema version at the end;
+        # the next ALTER commits them implicitly anyway.
+        if "user_id" in nullable_columns["jobs"]:
             try:
-                cursor.execute(stmt)
+                cursor.execute("SELECT id FROM users ORDER BY id LIMIT 1")
+                first_user = cursor.fetchone()
+                if first_user:
+                    default_user_id = first_user[0]
+                    cursor.execute("UPDATE jobs SET user_id=%s WHERE user_id IS NULL", (default_user_id,))
             except mysql.connector.Error:
-                # Likely "Duplicate column name" — ignore for beginner-friendly migrations.
                 pass
         
-        # After adding user_id column, try to assign existing rows to first user
-        # (This is a one-time migration; ongoing orphaned records are handled on login)
-        try:
-            cursor.execute("SELECT id FROM users ORDER BY id LIMIT 1")
-            first_user = cursor.fetchone()
-            if first_user:
-                default_user_id = first_user[0]
-                cursor.execute("UPDATE jobs SET user_id=%s WHERE user_id IS NULL", (default_user_id,))
-                conn.commit()
-        except mysql.connector.Error:
-            pass
-        
-        # Try to make user_id NOT NULL (will fail if there are still NULL values, which is OK)
-        # We'll handle orphaned records dynamically on login
-        try:
-            cursor.execute("ALTER TABLE jobs MODIFY COLUMN user_id INT NOT NULL")
-        except mysql.connector.Error:
-            # If there are still NULL values, that's OK - they'll be claimed on next login
-            pass
-        
-        try:
-            cursor.execute("ALTER TABLE jobs ADD CONSTRAINT fk_jobs_user FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE")
-        except mysql.connector.Error:
-            # Constraint might already exist
-            pass
-
-        alter_interviews_statements = [
-            "ALTER TABLE interviews ADD COLUMN user_id INT NULL",
-            "ALTER TABLE interviews ADD COLUMN company_tag VARCHAR(255) NOT NULL DEFAULT ''",
-            "ALTER TABLE interviews ADD COLUMN role_tag VARCHAR(255) NOT NULL DEFAULT ''",
-            "ALTER TABLE interviews ADD COLUMN interview_date DATE NULL",
-            "ALTER TABLE interviews ADD COLUMN interview_time TIME NULL",
-            "ALTER TABLE interviews ADD COLUMN interview_venue VARCHAR(255) NULL",
-            "ALTER TABLE interviews ADD COLUMN interview_completed TINYINT(1) NOT NULL DEFAULT 0",
-            "ALTER TABLE interviews ADD COLUMN interview_difficulty VARCHAR(50) NULL",
-            "ALTER TABLE interviews ADD COLUMN interview_experience_notes TEXT NULL",
-            "ALTER TABLE interviews ADD COLUMN created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
-            "ALTER TABLE interviews ADD COLUMN updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP",
-            "ALTER TABLE interviews ADD UNIQUE KEY uq_interviews_job (job_id)",
-        ]
-        for stmt in alter_interviews_statements:
+        # Try to make user_id NOT NULL; orphaned records are handled dynamically on login
+        make_user_id_required("jobs")
+        add_user_foreign_key("jobs", "fk_jobs_user")
+
+        add_missing_columns("interviews", {
+            "user_id": "INT NULL",
+            "company_tag": "VARCHAR(255) NOT NULL DEFAULT ''",
+            "role_tag": "VARCHAR(255) NOT NULL DEFAULT ''",
+            "interview_date": "DATE NULL",
+            "interview_time": "TIME NULL",
+            "interview_venue": "VARCHAR(255) NULL",
+            "interview_completed": "TINYINT(1) NOT NULL DEFAULT 0",
+            "interview_difficulty": "VARCHAR(50) NULL",
+            "interview_experience_notes": "TEXT NULL",
+            "created_at": "TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+            "updated_at": "TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP",
+        })
+        if "uq_interviews_job" not in existing_indexes["interviews"]:
             try:
-                cursor.execute(stmt)
+                cursor.execute("ALTER TABLE interviews ADD UNIQUE KEY uq_interviews_job (job_id)")
+                existing_indexes["interviews"].add("uq_interviews_job")
             except mysql.connector.Error:
+                # Duplicate job_ids in legacy data block the key
                 pass
         
         # Backfill user_id for existing interviews from jobs table
-        try:
-            cursor.execute("""
-                UPDATE interviews i
-                JOIN jobs j ON j.id = i.job_id
-                SET i.user_id = j.user_id
-                WHERE i.user_id IS NULL AND j.user_id IS NOT NULL
-            """)
-            conn.commit()
-        except mysql.connector.Error:
-            pass
-        
-        # Try to make user_id NOT NULL (will fail if there are still NULL values, which is OK)
-        # We'll handle orphaned records dynamically on login
-        try:
-            cursor.execute("ALTER TABLE interviews MODIFY COLUMN user_id INT NOT NULL")
-        except mysql.connector.Error:
-            # If there are still NULL values, that's OK - they'll be claimed on next login
-            pass
+        if "user_id" in nullable_columns["interviews"]:
+            try:
+                cursor.execute("""
+                    UPDATE interviews i
+                    JOIN jobs j ON j.id = i.job_id
+                    SET i.user_id = j.user_id
+                    WHERE i.user_id IS NULL AND j.user_id IS NOT NULL
+                """)
+            except mysql.connector.Error:
+                pass
         
-        try:
-            cursor.execute("ALTER TABLE interviews ADD CONSTRAINT fk_interviews_user FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE")
-        except mysql.connector.Error:
-            # Constraint might already exist
-            pass
+        # Try to make user_id NOT NULL; orphaned records are handled dynamically on login
+        make_user_id_required("interviews")
+        add_user_foreign_key("interviews", "fk_interviews_user")
 
         # Backfill company_tag / role_tag for existing interview rows if blank
         try:
@@ -650,112 +1143,115 @@ def ensure_schema():
 
         # Legacy support: some older interview tables have a required `venue` column.
         # Make sure it won't block inserts/migrations.
-        try:
+        if "venue" in existing_columns["interviews"]:
             cursor.execute("UPDATE interviews SET venue='Online' WHERE (venue IS NULL OR venue='')")
-        except mysql.connector.Error:
-            pass
 
         # Add new JSON columns to profiles table if they don't exist
-        alter_profiles_statements = [
-            "ALTER TABLE profiles ADD COLUMN cv_file_path VARCHAR(500) NULL",
-            "ALTER TABLE profiles ADD COLUMN cv_file_name VARCHAR(255) NULL",
-            "ALTER TABLE profiles ADD COLUMN cv_uploaded_at TIMESTAMP NULL",
-            "ALTER TABLE profiles ADD COLUMN email VARCHAR(255) NULL",
-            "ALTER TABLE profiles ADD COLUMN phone VARCHAR(50) NULL",
-            "ALTER TABLE profiles ADD COLUMN identity JSON NULL",
-            "ALTER TABLE profiles ADD COLUMN career_intent JSON NULL",
-            "ALTER TABLE profiles ADD COLUMN professional_summary TEXT NULL",
-            "ALTER TABLE profiles ADD COLUMN skills_json JSON NULL",
-            "ALTER TABLE profiles ADD COLUMN experience_json JSON NULL",
-            "ALTER TABLE profiles ADD COLUMN education_json JSON NULL",
-            "ALTER TABLE profiles ADD COLUMN projects_json JSON NULL",
-            "ALTER TABLE profiles ADD COLUMN achievements_json JSON NULL",
-        ]
-        for stmt in alter_profiles_statements:
-            try:
-                cursor.execute(stmt)
-            except mysql.connector.Error:
-                # Column might already exist
-                pass
+        add_missing_columns("profiles", {
+            "cv_file_path": "VARCHAR(500) NULL",
+            "cv_file_name": "VARCHAR(255) NULL",
+            "cv_uploaded_at": "TIMESTAMP NULL",
+            "email": "VARCHAR(255) NULL",
+            "phone": "VARCHAR(50) NULL",
+            "identity": "JSON NULL",
+            "career_intent": "JSON NULL",
+            "professional_summary": "TEXT NULL",
+            "skills_json": "JSON NULL",
+            "experience_json": "JSON NULL",
+            "education_json": "JSON NULL",
+            "projects_json": "JSON NULL",
+            "achievements_json": "JSON NULL",
+        })
+
+        # Secondary indexes for the dashboard filters and the interviews page.
+        # MySQL has no CREATE INDEX IF NOT EXISTS, so existing_indexes is checked first.
+        def add_missing_indexes(table: str, indexes: dict[str, str]) -> None:
+            missing = [name for name in indexes if name not in existing_indexes[table]]
+            if missing:
+                actions = ", ".join(f"ADD INDEX {name} ({indexes[name]})" for name in missing)
+                cursor.execute(f"ALTER TABLE {table} {actions}")
+                existing_indexes[table].update(missing)
+
+        add_missing_indexes("jobs", {
+            "ix_jobs_status_applied": "status, applied_date",
+            "ix_jobs_company": "company",
+            # Per-user dashboard: ORDER BY applied_date (InnoDB appends id), optional status filter
+            "ix_jobs_user_applied": "user_id, applied_date",
+            "ix_jobs_user_status": "user_id, status, applied_date",
+        })
+        add_missing_indexes("interviews", {
+            "ix_interviews_job_date": "job_id, interview_date, interview_completed",
+            # interviews() page: one user's rows in date/time order
+            "ix_interviews_user_date": "user_id, interview_date, interview_time",
+        })
 
         # One-time-ish migration: copy legacy interview_* data from jobs into interviews
         # if the interviews row doesn't exist yet.
-        cursor.execute("SHOW COLUMNS FROM interviews")
-        interviews_cols = {row[0] for row in (cursor.fetchall() or [])}
-
+        # No more ALTERs below, so this is the final column set
+        interviews_cols = existing_columns["interviews"]
+        _INTERVIEWS_COLUMNS = interviews_cols
+        _VENUE_EXPR = None
+        _COMPLETE_INTERVIEW_SQL = None
+
+        venue_columns = interview_venue_columns(interviews_cols)
+        columns = [
+            "job_id", "user_id", "company_tag", "role_tag",
+            "interview_date", "interview_time", *venue_columns,
+            "interview_completed", "interview_difficulty", "interview_experience_notes",
+        ]
+        venue_values = ["COALESCE(j.interview_venue, 'Online')"] * len(venue_columns)
+        # Copied server-side in one statement, no rows round-trip through Python
         cursor.execute(
-            """
-            SELECT j.id AS job_id, j.user_id, j.company, j.role, j.interview_date, j.interview_time, j.interview_venue,
-                   j.interview_completed, j.interview_difficulty, j.interview_experience_notes
+            f"""
+            INSERT INTO interviews ({', '.join(columns)})
+            SELECT j.id, j.user_id, j.company, j.role, j.interview_date, j.interview_time, {', '.join(venue_values)},
+                   COALESCE(j.interview_completed, 0), j.interview_difficulty, j.interview_experience_notes
             FROM jobs j
             LEFT JOIN interviews i ON i.job_id = j.id
             WHERE i.job_id IS NULL
               AND j.interview_date IS NOT NULL
             """
         )
-        rows = cursor.fetchall() or []
-        for (job_id, user_id, company, role, i_date, i_time, i_venue, i_completed, i_diff, i_notes) in rows:
-            venue_value = i_venue or "Online"
-            if "venue" in interviews_cols:
-                cursor.execute(
-                    """
-                    INSERT INTO interviews (
-                      job_id, user_id, company_tag, role_tag,
-                      interview_date, interview_time, venue,
-                      interview_completed, interview_difficulty, interview_experience_notes
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        job_id,
-                        user_id,
-                        company,
-                        role,
-                        i_date,
-                        i_time,
-                        venue_value,
-                        int(i_completed or 0),
-                        i_diff,
-                        i_notes,
-                    ),
-                )
-                if "interview_venue" in interviews_cols:
-                    cursor.execute(
-                        "UPDATE interviews SET interview_venue=%s WHERE job_id=%s AND user_id=%s",
-                        (venue_value, job_id, user_id),
-                    )
-            else:
-                cursor.execute(
-                    """
-                    INSERT INTO interviews (
-                      job_id, user_id, company_tag, role_tag,
-                      interview_date, interview_time, interview_venue,
-                      interview_completed, interview_difficulty, interview_experience_notes
-                    )
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        job_id,
-                        user_id,
-                        company,
-                        role,
-                        i_date,
-                        i_time,
-                        venue_value,
-                        int(i_completed or 0),
-                        i_diff,
-                        i_notes,
-                    ),
-                )
 
+        cursor.execute("REPLACE INTO schema_version (v) VALUES (%s)", (CURRENT_SCHEMA_VERSION,))
         conn.commit()
     finally:
         if cursor is not None:
+            if locked:
+                try:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", (SCHEMA_LOCK_NAME,))
+                    cursor.fetchone()
+                except mysql.connector.Error:
+                    pass
             cursor.close()
         if conn is not None:
             conn.close()
 
 
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+
+@app.before_request
+def ensure_schema_once():
+    """
+    Run ensure_schema() on the first request of each worker (WSGI servers never
+    reach the __main__ block). Later requests only check a flag; a failed attempt
+    is retried on the next request.
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if _schema_ready:
+            return
+        try:
+            ensure_schema()
+            _schema_ready = True
+        except mysql.connector.Error as e:
+            print(f"[WARN] Could not ensure schema: {e}")
+
+
 # ============================================================================
 # Authentication helpers
 # ============================================================================
@@ -822,13 +1318,13 @@ def register():
         cursor = conn.cursor()
 
         # Check if email already exists
-        cursor.execute("SELECT id FROM users WHERE email = %s", (email,))
+        cursor.execute("SELECT 1 FROM users WHERE email = %s LIMIT 1", (email,))
         if cursor.fetchone():
             flash("Email already registered. Please log in instead.", "danger")
             return redirect(url_for("login"))
 
         # Create new user
-        password_hash = generate_password_hash(password)
+        password_hash = hash_password(password)
         cursor.execute(
             "INSERT INTO users (name, email, password_hash) VALUES (%s, %s, %s)",
             (name, email, password_hash),
@@ -868,21 +1364,38 @@ def login():
     cursor = None
     try:
         conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
-        cursor.execute("SELECT id, name, email, password_hash FROM users WHERE email = %s", (email,))
-        user = cursor.fetchone()
-
-        if user and check_password_hash(user["password_hash"], password):
-            session["user_id"] = user["id"]
-            session["user_name"] = user["name"]
-            session["user_email"] = user["email"]
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, name, email, password_hash FROM users WHERE email = %s LIMIT 1", (email,))
+        row = cursor.fetchone()
+
+        matches, needs_rehash = False, False
+        if row:
+            user_id, user_name, user_email, pw_hash = row
+            matches, needs_rehash = verify_password(pw_hash, password)
+        if matches:
+            if needs_rehash:
+                # Upgrade legacy hashes on successful login; never block the login on it
+                try:
+                    cursor.execute(
+                        "UPDATE users SET password_hash=%s WHERE id=%s",
+                        (hash_password(password), user_id),
+                    )
+                    conn.commit()
+                except mysql.connector.Error:
+                    conn.rollback()
+
+            session["user_id"] = user_id
+            session["user_name"] = user_name
+            session["user_email"] = user_email
+            # Fresh cache generation so entries cached under an earlier session are never reused
+            session["_cache_gen"] = _time.time_ns()
             
             # Claim any orphaned records (jobs/interviews without user_id) for this user
-            jobs_claimed, interviews_claimed = claim_orphaned_records(user["id"])
+            jobs_claimed, interviews_claimed = claim_orphaned_records(user_id)
             if jobs_claimed > 0 or interviews_claimed > 0:
-                flash(f"Welcome back, {user['name']}! Migrated {jobs_claimed} job(s) and {interviews_claimed} interview(s) to your account.", "info")
+                flash(f"Welcome back, {user_name}! Migrated {jobs_claimed} job(s) and {interviews_claimed} interview(s) to your account.", "info")
             else:
-                flash(f"Welcome back, {user['name']}!", "success")
+                flash(f"Welcome back, {user_name}!", "success")
             return redirect(url_for("index"))
         else:
             flash("Invalid email or password.", "danger")
@@ -927,8 +1440,8 @@ def index():
     
     conn = None
     cursor = None
-    jobs: list[dict] = []
-    follow_up_reminders: list[dict] = []
+    jobs: list = []
+    follow_up_reminders: list = []
     error_message = None
     today = date.today()
 
@@ -940,103 +1453,66 @@ def index():
     if filter_status and filter_status not in ALLOWED_STATUSES:
         filter_status = ""
 
-    try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
-        interviews_cols = get_interviews_columns()
-        venue_expr = "i.interview_venue"
-        if "venue" in interviews_cols and "interview_venue" in interviews_cols:
-            venue_expr = "COALESCE(i.interview_venue, i.venue)"
-        elif "venue" in interviews_cols and "interview_venue" not in interviews_cols:
-            venue_expr = "i.venue"
-
-        # Build WHERE clause based on filters
-        where_conditions = []
-        query_params = []
-
-        if filter_company:
-            where_conditions.append("j.company LIKE %s")
-            query_params.append(f"%{filter_company}%")
-
-        if filter_status:
-            where_conditions.append("j.status = %s")
-            query_params.append(filter_status)
-
-        # CRITICAL: Always filter by user_id for security
-        where_conditions.append("j.user_id = %s")
-        query_params.append(session["user_id"])
-
-        where_clause = "WHERE " + " AND ".join(where_conditions)
-
-        # CRITICAL: LEFT JOIN must also filter by user_id to prevent cross-user data leaks
-        query = f"""
-            SELECT
-              j.id, j.company, j.role, j.location, j.job_link, j.status, j.applied_date, j.notes,
-              i.interview_date, i.interview_time, {venue_expr} AS interview_venue, i.interview_completed,
-              i.interview_difficulty, i.interview_experience_notes
-            FROM jobs j
-            LEFT JOIN interviews i ON i.job_id = j.id AND i.user_id = j.user_id
-            {where_clause}
-            ORDER BY j.applied_date DESC, j.id DESC
-            """
-
-        cursor.execute(query, query_params)
-        jobs = cursor.fetchall() or []
+    page = max(request.args.get("page", 1, type=int), 1)
+    page_size = min(max(request.args.get("page_size", JOBS_PAGE_SIZE, type=int), 1), JOBS_MAX_PAGE_SIZE)
+    has_next = False
 
-        # Fetch jobs needing follow-up reminders (status="Applied" AND applied_date older than 3 days)
-        # Using SQL date logic: applied_date < CURDATE() - INTERVAL 3 DAY
-        # CRITICAL: Filter by user_id for security
-        cursor.execute(
-            f"""
-            SELECT
-              j.id, j.company, j.role, j.location, j.job_link, j.status, j.applied_date, j.notes,
-              DATEDIFF(CURDATE(), j.applied_date) AS days_ago
-            FROM jobs j
-            WHERE j.status = 'Applied'
-              AND j.applied_date < DATE_SUB(CURDATE(), INTERVAL 3 DAY)
-              AND j.user_id = %s
-            ORDER BY j.applied_date ASC
-            """,
-            (session["user_id"],),
-        )
-        follow_up_reminders = cursor.fetchall() or []
-
-        # Auto status reminder: Applied for 3+ days => show follow-up reminder (for individual job rows)
-        for job in jobs:
-            job["follow_up_reminder"] = False
-            if job.get("status") == "Applied" and job.get("applied_date"):
-                try:
-                    days = (today - job["applied_date"]).days
-                    job["follow_up_reminder"] = days >= 3
-                except Exception:
-                    job["follow_up_reminder"] = False
-
-            # If status is Interview but details aren't filled yet, show a gentle prompt
-            job["needs_interview_details"] = job.get("status") == "Interview" and not job.get("interview_date")
-    except mysql.connector.Error as e:
-        error_message = f"Database error: {e}"
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
+    cache_key = user_cache_key(session["user_id"], "index", filter_company, filter_status, page, page_size)
+    cached = list_cache_get(cache_key)
+    if cached is not None:
+        jobs, follow_up_reminders, has_next = cached
+    else:
+        try:
+            conn = get_connection()
+            cursor = conn.cursor()
+
+            # CRITICAL: Always filter by user_id for security
+            query_params = [session["user_id"]]
+            if filter_company:
+                query_params.append(f"%{filter_company}%")
+            if filter_status:
+                query_params.append(filter_status)
+            query = index_jobs_sql(bool(filter_company), bool(filter_status), conn)
+
+            # One extra row tells us whether there is a next page without a COUNT query
+            cursor.execute(query, (*query_params, page_size + 1, (page - 1) * page_size))
+            jobs = rows_as_namedtuples(cursor)
+            has_next = len(jobs) > page_size
+            del jobs[page_size:]
+
+            # Jobs needing follow-up reminders (status="Applied" AND applied_date older than 3 days).
+            # When the unfiltered first page already holds every job of this user, pick them
+            # out (oldest first) instead of a second round trip.
+            if not filter_company and not filter_status and page == 1 and not has_next:
+                follow_up_reminders = [
+                    job for job in reversed(jobs)
+                    if job.status == "Applied" and job.days_ago is not None and job.days_ago > 3
+                ]
+            else:
+                cursor.execute(FOLLOW_UP_REMINDERS_SQL, (session["user_id"],))
+                follow_up_reminders = rows_as_namedtuples(cursor)
+            list_cache_put(cache_key, (jobs, follow_up_reminders, has_next))
+        except mysql.connector.Error as e:
+            error_message = f"Database error: {e}"
+        finally:
+            if cursor is not None:
+                cursor.close()
+            if conn is not None:
+                conn.close()
 
-    status_badge = {
-        "Applied": "secondary",
-        "Interview": "info",
-        "Rejected": "danger",
-        "Offer": "success",
-    }
     return render_template(
         "index.html",
         jobs=jobs,
         error_message=error_message,
-        status_badge=status_badge,
+        status_badge=STATUS_BADGE,
         today=today,
         filter_company=filter_company,
         filter_status=filter_status,
-        allowed_statuses=ALLOWED_STATUSES,
+        allowed_statuses=ALLOWED_STATUSES_ORDER,
         follow_up_reminders=follow_up_reminders,
+        page=page,
+        page_size=page_size,
+        has_next=has_next,
     )
 
 
@@ -1044,7 +1520,7 @@ def index():
 @login_required
 def add_job_form():
     # Provide a reasonable default date for the form
-    return render_template("add_job.html", statuses=ALLOWED_STATUSES, today=date.today().isoformat())
+    return render_template("add_job.html", statuses=ALLOWED_STATUSES_ORDER, today=date.today().isoformat())
 
 
 @app.route("/add", methods=["POST"])
@@ -1074,79 +1550,60 @@ def add_job_submit():
         flash("Invalid status selected.", "danger")
         return redirect(url_for("add_job_form"))
 
-    conn = None
-    cursor = None
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        # SECURITY: user_id is ALWAYS from session, NEVER from form input
-        cursor.execute(
-            """
-            INSERT INTO jobs (user_id, company, role, location, job_link, status, applied_date, notes)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """,
-            (session["user_id"], company, role, location, job_link, status, applied_date_str, notes),
-        )
-        conn.commit()
-        flash("Job added successfully.", "success")
-        return redirect(url_for("index"))
+        with db_cursor() as (conn, cursor):
+            # SECURITY: user_id is ALWAYS from session, NEVER from form input
+            cursor.execute(
+                INSERT_JOB_SQL,
+                (session["user_id"], company, role, location, job_link, status, applied_date_str, notes),
+            )
+            conn.commit()
     except mysql.connector.Error as e:
-        if conn is not None:
-            conn.rollback()
         flash(f"Failed to add job: {e}", "danger")
         return redirect(url_for("add_job_form"))
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
+
+    invalidate_user_cache(session["user_id"])
+    flash("Job added successfully.", "success")
+    return redirect(url_for("index"))
 
 
-def fetch_job(job_id: int) -> dict | None:
+def fetch_job(job_id: int, use_cache: bool = True) -> dict | None:
     """
     Fetch a job by ID, ensuring it belongs to the current user.
     Returns None if job doesn't exist or doesn't belong to user.
+    Results are memoized on flask.g for the rest of the request, and found jobs
+    for JOB_CACHE_TTL in the per-user list cache so the edit/confirm/complete
+    pages reuse them. Pass use_cache=False when the row drives a write.
     """
     if "user_id" not in session:
         return None
-    
-    conn = None
-    cursor = None
+
+    cache_key = (job_id, session["user_id"])
+    jobs_cache = g.setdefault("_jobs", {})
+    shared_key = user_cache_key(session["user_id"], "job", job_id)
+    if use_cache:
+        if cache_key in jobs_cache:
+            return jobs_cache[cache_key]
+        cached = list_cache_get(shared_key, JOB_CACHE_TTL)
+        if cached is not None:
+            # A private copy, so callers can't change the entry other requests see
+            job = jobs_cache[cache_key] = dict(cached)
+            return job
+
     try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
-        interviews_cols = get_interviews_columns()
-        venue_expr = "i.interview_venue"
-        if "venue" in interviews_cols and "interview_venue" in interviews_cols:
-            venue_expr = "COALESCE(i.interview_venue, i.venue)"
-        elif "venue" in interviews_cols and "interview_venue" not in interviews_cols:
-            venue_expr = "i.venue"
-
-        # CRITICAL: LEFT JOIN must also filter by user_id to prevent cross-user data leaks
-        cursor.execute(
-            f"""
-            SELECT
-              j.id, j.company, j.role, j.location, j.job_link, j.status, j.applied_date, j.notes,
-              i.interview_date, i.interview_time, {venue_expr} AS interview_venue, i.interview_completed,
-              i.interview_difficulty, i.interview_experience_notes, j.user_id
-            FROM jobs j
-            LEFT JOIN interviews i ON i.job_id = j.id AND i.user_id = j.user_id
-            WHERE j.id = %s AND j.user_id = %s
-            """,
-            (job_id, session["user_id"]),
-        )
-        return cursor.fetchone()
+        with db_cursor(dictionary=True) as (conn, cursor):
+            cursor.execute(venue_sql(FETCH_JOB_SQL, conn), (job_id, session["user_id"]))
+            job = jobs_cache[cache_key] = cursor.fetchone()
     except mysql.connector.Error as e:
         print(f"Error fetching job: {e}")
         return None
     except Exception as e:
         print(f"Unexpected error fetching job: {e}")
         return None
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
+
+    if job is not None:
+        list_cache_put(shared_key, dict(job))
+    return job
 
 
 @app.route("/jobs/<int:job_id>/edit", methods=["GET"])
@@ -1161,7 +1618,7 @@ def edit_job_form(job_id: int):
     return render_template(
         "edit_job.html",
         job=job,
-        statuses=ALLOWED_STATUSES,
+        statuses=ALLOWED_STATUSES_ORDER,
     )
 
 
@@ -1191,34 +1648,21 @@ def edit_job_submit(job_id: int):
         flash("Invalid status selected.", "danger")
         return redirect(url_for("edit_job_form", job_id=job_id))
 
-    conn = None
-    cursor = None
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        # CRITICAL: Filter by user_id in UPDATE to prevent unauthorized access
-        cursor.execute(
-            """
-            UPDATE jobs
-            SET company=%s, role=%s, location=%s, job_link=%s, status=%s, applied_date=%s, notes=%s
-            WHERE id=%s AND user_id=%s
-            """,
-            (company, role, location, job_link, status, applied_date_str, notes, job_id, session["user_id"]),
-        )
-        if cursor.rowcount == 0:
-            flash("Job not found or you don't have permission to edit it.", "danger")
-            return redirect(url_for("index"))
-        conn.commit()
+        with db_cursor() as (conn, cursor):
+            # CRITICAL: Filter by user_id in UPDATE to prevent unauthorized access
+            cursor.execute(
+                UPDATE_JOB_SQL,
+                (company, role, location, job_link, status, applied_date_str, notes, job_id, session["user_id"]),
+            )
+            if cursor.rowcount == 0:
+                flash("Job not found or you don't have permission to edit it.", "danger")
+                return redirect(url_for("index"))
+            conn.commit()
     except mysql.connector.Error as e:
-        if conn is not None:
-            conn.rollback()
         flash(f"Failed to update job: {e}", "danger")
         return redirect(url_for("edit_job_form", job_id=job_id))
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
+    invalidate_user_cache(session["user_id"])
 
     # If status is Interview, confirm interview details next
     if status == "Interview":
@@ -1241,40 +1685,31 @@ def delete_job(job_id: int):
         flash("Job not found or you don't have permission to delete it.", "danger")
         return redirect(url_for("index"))
     
-    conn = None
-    cursor = None
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # Fetch job details for flash message
-        cursor.execute("SELECT company, role FROM jobs WHERE id=%s AND user_id=%s", (job_id, session["user_id"]))
-        job = cursor.fetchone()
-        
-        if not job:
-            flash("Job not found or you don't have permission to delete it.", "danger")
-            return redirect(url_for("index"))
-        
-        # Delete the job (cascading foreign keys will automatically delete associated interviews)
-        cursor.execute("DELETE FROM jobs WHERE id=%s AND user_id=%s", (job_id, session["user_id"]))
-        
-        if cursor.rowcount == 0:
-            flash("Job not found or you don't have permission to delete it.", "danger")
-            return redirect(url_for("index"))
-        
-        conn.commit()
-        flash(f"Job '{job[0]} - {job[1]}' has been deleted.", "success")
-        return redirect(url_for("index"))
+        with db_cursor() as (conn, cursor):
+            # Fetch job details for flash message
+            cursor.execute("SELECT company, role FROM jobs WHERE id=%s AND user_id=%s", (job_id, session["user_id"]))
+            job = cursor.fetchone()
+
+            if not job:
+                flash("Job not found or you don't have permission to delete it.", "danger")
+                return redirect(url_for("index"))
+
+            # Delete the job (cascading foreign keys will automatically delete associated interviews)
+            cursor.execute("DELETE FROM jobs WHERE id=%s AND user_id=%s", (job_id, session["user_id"]))
+
+            if cursor.rowcount == 0:
+                flash("Job not found or you don't have permission to delete it.", "danger")
+                return redirect(url_for("index"))
+
+            conn.commit()
     except mysql.connector.Error as e:
-        if conn is not None:
-            conn.rollback()
         flash(f"Failed to delete job: {e}", "danger")
         return redirect(url_for("index"))
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
+
+    invalidate_user_cache(session["user_id"])
+    flash(f"Job '{job[0]} - {job[1]}' has been deleted.", "success")
+    return redirect(url_for("index"))
 
 
 @app.route("/jobs/<int:job_id>/interview/confirm", methods=["GET", "POST"])
@@ -1285,7 +1720,8 @@ def confirm_interview(job_id: int):
         flash("Job not found or you don't have permission to access it.", "danger")
         return redirect(url_for("index"))
     
-    job = fetch_job(job_id)
+    # POSTs write from this row, so they read it fresh rather than from the cache
+    job = fetch_job(job_id, use_cache=request.method == "GET")
     if not job:
         flash("Job not found or you don't have permission to access it.", "danger")
         return redirect(url_for("index"))
@@ -1295,34 +1731,17 @@ def confirm_interview(job_id: int):
         calendar_url = None
         if job.get("interview_date") and job.get("interview_time"):
             try:
-                # Parse date and time
-                interview_date_obj = job["interview_date"]
-                if isinstance(interview_date_obj, str):
-                    interview_date_obj = datetime.strptime(interview_date_obj, "%Y-%m-%d").date()
-                elif isinstance(interview_date_obj, date):
-                    pass
-                else:
-                    interview_date_obj = None
-
-                interview_time_str = job.get("interview_time")
-                if interview_time_str:
-                    if isinstance(interview_time_str, str):
-                        time_parts = interview_time_str.split(":")
-                        if len(time_parts) >= 2:
-                            start_datetime = datetime.combine(
-                                interview_date_obj,
-                                datetime.strptime(interview_time_str, "%H:%M:%S").time() if ":" in interview_time_str and len(interview_time_str.split(":")) == 3 else datetime.strptime(interview_time_str, "%H:%M").time(),
-                            )
-                            title = f"Interview: {job['company']} - {job['role']}"
-                            description = f"Job Application Interview\n\nCompany: {job['company']}\nRole: {job['role']}\nLocation: {job.get('location', 'N/A')}"
-                            location = job.get("interview_venue") or "Online"
-                            calendar_url = generate_google_calendar_url(
-                                title=title,
-                                start_datetime=start_datetime,
-                                description=description,
-                                location=location,
-                            )
-            except Exception:
+                start_datetime = datetime.combine(job["interview_date"], time.fromisoformat(job["interview_time"]))
+                title = f"Interview: {job['company']} - {job['role']}"
+                description = f"Job Application Interview\n\nCompany: {job['company']}\nRole: {job['role']}\nLocation: {job.get('location', 'N/A')}"
+                location = job.get("interview_venue") or "Online"
+                calendar_url = generate_google_calendar_url(
+                    title=title,
+                    start_datetime=start_datetime,
+                    description=description,
+                    location=location,
+                )
+            except ValueError:
                 calendar_url = None
 
         return render_template("confirm_interview.html", job=job, calendar_url=calendar_url)
@@ -1340,7 +1759,7 @@ def confirm_interview(job_id: int):
     try:
         conn = get_connection()
         cursor = conn.cursor()
-        interviews_cols = get_interviews_columns()
+        interviews_cols = get_interviews_columns(conn)
         # CRITICAL: Ensure job status is Interview and validate ownership
         cursor.execute("UPDATE jobs SET status='Interview' WHERE id=%s AND user_id=%s", (job_id, session["user_id"]))
         if cursor.rowcount == 0:
@@ -1348,85 +1767,48 @@ def confirm_interview(job_id: int):
             return redirect(url_for("index"))
 
         # Store interview in interviews table (one interview per job for now).
-        # CRITICAL: Include user_id for security
-        if "venue" in interviews_cols:
-            cursor.execute(
-                """
-                INSERT INTO interviews (
-                  job_id, user_id, company_tag, role_tag,
-                  interview_date, interview_time, venue,
-                  interview_completed
-                )
-                VALUES (
-                  %s, %s,
-                  (SELECT company FROM jobs WHERE id=%s AND user_id=%s),
-                  (SELECT role FROM jobs WHERE id=%s AND user_id=%s),
-                  %s, %s, %s,
-                  0
-                )
-                ON DUPLICATE KEY UPDATE
-                  company_tag=VALUES(company_tag),
-                  role_tag=VALUES(role_tag),
-                  interview_date=VALUES(interview_date),
-                  interview_time=VALUES(interview_time),
-                  venue=VALUES(venue),
-                  interview_completed=0
-                """,
-                (job_id, session["user_id"], job_id, session["user_id"], job_id, session["user_id"], interview_date, interview_time, interview_venue),
-            )
-            if "interview_venue" in interviews_cols:
-                cursor.execute(
-                    "UPDATE interviews SET interview_venue=%s WHERE job_id=%s AND user_id=%s",
-                    (interview_venue, job_id, session["user_id"]),
-                )
-        else:
-            cursor.execute(
-                """
-                INSERT INTO interviews (
-                  job_id, user_id, company_tag, role_tag,
-                  interview_date, interview_time, interview_venue,
-                  interview_completed
-                )
-                VALUES (
-                  %s, %s,
-                  (SELECT company FROM jobs WHERE id=%s AND user_id=%s),
-                  (SELECT role FROM jobs WHERE id=%s AND user_id=%s),
-                  %s, %s, %s,
-                  0
-                )
-                ON DUPLICATE KEY UPDATE
-                  company_tag=VALUES(company_tag),
-                  role_tag=VALUES(role_tag),
-                  interview_date=VALUES(interview_date),
-                  interview_time=VALUES(interview_time),
-                  interview_venue=VALUES(interview_venue),
-                  interview_completed=0
-                """,
-                (job_id, session["user_id"], job_id, session["user_id"], job_id, session["user_id"], interview_date, interview_time, interview_venue),
+        # CRITICAL: Include user_id for security. Company/role come from the job
+        # fetched (and ownership-checked) above.
+        venue_columns = interview_venue_columns(interviews_cols)
+        venue_updates = "".join(f"{column}=VALUES({column}), " for column in venue_columns)
+        cursor.execute(
+            f"""
+            INSERT INTO interviews (
+              job_id, user_id, company_tag, role_tag,
+              interview_date, interview_time, {', '.join(venue_columns)},
+              interview_completed
             )
+            VALUES (%s, %s, %s, %s, %s, %s, {', '.join(['%s'] * len(venue_columns))}, 0)
+            ON DUPLICATE KEY UPDATE
+              company_tag=VALUES(company_tag),
+              role_tag=VALUES(role_tag),
+              interview_date=VALUES(interview_date),
+              interview_time=VALUES(interview_time),
+              {venue_updates}interview_completed=0
+            """,
+            (
+                job_id, session["user_id"], job["company"], job["role"],
+                interview_date, interview_time, *[interview_venue] * len(venue_columns),
+            ),
+        )
         conn.commit()
+        invalidate_user_cache(session["user_id"])
         
         # Generate Google Calendar URL after saving
         calendar_url = None
         try:
-            interview_date_obj = datetime.strptime(interview_date, "%Y-%m-%d").date()
-            interview_time_obj = datetime.strptime(interview_time, "%H:%M").time()
-            start_datetime = datetime.combine(interview_date_obj, interview_time_obj)
+            start_datetime = datetime.combine(date.fromisoformat(interview_date), time.fromisoformat(interview_time))
             
-            # Fetch company and role for calendar event - CRITICAL: Filter by user_id
-            cursor.execute("SELECT company, role, location FROM jobs WHERE id=%s AND user_id=%s", (job_id, session["user_id"]))
-            job_info = cursor.fetchone()
-            
-            if job_info:
-                title = f"Interview: {job_info[0]} - {job_info[1]}"
-                description = f"Job Application Interview\n\nCompany: {job_info[0]}\nRole: {job_info[1]}\nLocation: {job_info[2] if job_info[2] else 'N/A'}"
-                location = interview_venue
-                calendar_url = generate_google_calendar_url(
-                    title=title,
-                    start_datetime=start_datetime,
-                    description=description,
-                    location=location,
-                )
+            # Company, role and location for the calendar event come from the job fetched above
+            title = f"Interview: {job['company']} - {job['role']}"
+            description = f"Job Application Interview\n\nCompany: {job['company']}\nRole: {job['role']}\nLocation: {job['location'] if job['location'] else 'N/A'}"
+            location = interview_venue
+            calendar_url = generate_google_calendar_url(
+                title=title,
+                start_datetime=start_datetime,
+                description=description,
+                location=location,
+            )
         except Exception:
             calendar_url = None
         
@@ -1456,7 +1838,8 @@ def complete_interview(job_id: int):
         flash("Job not found or you don't have permission to access it.", "danger")
         return redirect(url_for("index"))
     
-    job = fetch_job(job_id)
+    # POSTs write from this row, so they read it fresh rather than from the cache
+    job = fetch_job(job_id, use_cache=request.method == "GET")
     if not job:
         flash("Job not found or you don't have permission to access it.", "danger")
         return redirect(url_for("index"))
@@ -1469,7 +1852,7 @@ def complete_interview(job_id: int):
         return render_template(
             "complete_interview.html",
             job=job,
-            difficulties=ALLOWED_DIFFICULTIES,
+            difficulties=ALLOWED_DIFFICULTIES_ORDER,
         )
 
     difficulty = (request.form.get("interview_difficulty") or "").strip()
@@ -1484,26 +1867,16 @@ def complete_interview(job_id: int):
     try:
         conn = get_connection()
         cursor = conn.cursor()
-        interviews_cols = get_interviews_columns()
         # CRITICAL: Filter by user_id to prevent unauthorized access
         cursor.execute(
-            """
-            UPDATE interviews
-            SET interview_completed=1,
-                interview_difficulty=%s,
-                interview_experience_notes=%s
-            WHERE job_id=%s AND user_id=%s
-            """,
+            get_complete_interview_sql(conn),
             (difficulty or None, notes, job_id, session["user_id"]),
         )
         if cursor.rowcount == 0:
             flash("Interview not found or you don't have permission to access it.", "danger")
             return redirect(url_for("index"))
-        if "status" in interviews_cols:
-            cursor.execute("UPDATE interviews SET status='Completed' WHERE job_id=%s AND user_id=%s", (job_id, session["user_id"]))
-        if "experience" in interviews_cols:
-            cursor.execute("UPDATE interviews SET experience=%s WHERE job_id=%s AND user_id=%s", (notes, job_id, session["user_id"]))
         conn.commit()
+        invalidate_user_cache(session["user_id"])
         flash("Interview marked as completed and saved.", "success")
         return redirect(url_for("interviews"))
     except mysql.connector.Error as e:
@@ -1523,116 +1896,39 @@ def complete_interview(job_id: int):
 def interviews():
     conn = None
     cursor = None
-    upcoming: list[dict] = []
-    past: list[dict] = []
+    upcoming: list = []
+    past: list = []
     error_message = None
     today = date.today()
-    soon_threshold = today + timedelta(days=3)
-
-    try:
-        conn = get_connection()
-        cursor = conn.cursor(dictionary=True)
+    soon_threshold = today + SOON_WINDOW
 
-        interviews_cols = get_interviews_columns()
-        venue_expr = "i.interview_venue"
-        if "venue" in interviews_cols and "interview_venue" in interviews_cols:
-            venue_expr = "COALESCE(i.interview_venue, i.venue)"
-        elif "venue" in interviews_cols and "interview_venue" not in interviews_cols:
-            venue_expr = "i.venue"
-
-        # CRITICAL: Filter by user_id on BOTH tables for security - validate ownership on both
-        cursor.execute(
-            f"""
-            SELECT
-              i.job_id AS id,
-              i.company_tag AS company,
-              i.role_tag AS role,
-              i.interview_date, i.interview_time, {venue_expr} AS interview_venue,
-              i.interview_completed, i.interview_difficulty, i.interview_experience_notes
-            FROM interviews i
-            JOIN jobs j ON j.id = i.job_id AND j.user_id = i.user_id
-            WHERE j.status='Interview'
-              AND i.interview_completed=0
-              AND i.interview_date >= CURDATE()
-              AND i.user_id = %s
-              AND j.user_id = %s
-            ORDER BY i.interview_date ASC, i.interview_time ASC
-            """,
-            (session["user_id"], session["user_id"]),
-        )
-        upcoming = cursor.fetchall() or []
-
-        # CRITICAL: Filter by user_id on BOTH tables for security - validate ownership on both
-        cursor.execute(
-            f"""
-            SELECT
-              i.job_id AS id,
-              i.company_tag AS company,
-              i.role_tag AS role,
-              i.interview_date, i.interview_time, {venue_expr} AS interview_venue,
-              i.interview_completed, i.interview_difficulty, i.interview_experience_notes
-            FROM interviews i
-            JOIN jobs j ON j.id = i.job_id AND j.user_id = i.user_id
-            WHERE j.status='Interview'
-              AND (i.interview_completed=1 OR i.interview_date < CURDATE())
-              AND i.user_id = %s
-              AND j.user_id = %s
-            ORDER BY i.interview_date DESC, i.interview_time DESC
-            """,
-            (session["user_id"], session["user_id"]),
-        )
-        past = cursor.fetchall() or []
-
-        # Generate Google Calendar URLs for interviews
-        for item in upcoming:
-            item["is_today"] = bool(item.get("interview_date") == today)
-            item["is_soon"] = bool(item.get("interview_date") and today <= item["interview_date"] <= soon_threshold)
-            
-            # Generate calendar URL
-            calendar_url = None
-            if item.get("interview_date") and item.get("interview_time"):
-                try:
-                    interview_date_obj = item["interview_date"]
-                    if isinstance(interview_date_obj, str):
-                        interview_date_obj = datetime.strptime(interview_date_obj, "%Y-%m-%d").date()
-                    elif not isinstance(interview_date_obj, date):
-                        interview_date_obj = None
-                    
-                    interview_time_str = item.get("interview_time")
-                    if interview_date_obj and interview_time_str:
-                        if isinstance(interview_time_str, str):
-                            time_parts = interview_time_str.split(":")
-                            if len(time_parts) >= 2:
-                                try:
-                                    if len(time_parts) == 3:
-                                        time_obj = datetime.strptime(interview_time_str, "%H:%M:%S").time()
-                                    else:
-                                        time_obj = datetime.strptime(interview_time_str, "%H:%M").time()
-                                    start_datetime = datetime.combine(interview_date_obj, time_obj)
-                                    title = f"Interview: {item['company']} - {item['role']}"
-                                    description = f"Job Application Interview\n\nCompany: {item['company']}\nRole: {item['role']}"
-                                    location = item.get("interview_venue") or "Online"
-                                    calendar_url = generate_google_calendar_url(
-                                        title=title,
-                                        start_datetime=start_datetime,
-                                        description=description,
-                                        location=location,
-                                    )
-                                except Exception:
-                                    pass
-                except Exception:
-                    pass
-            item["calendar_url"] = calendar_url
+    cache_key = user_cache_key(session["user_id"], "interviews")
+    cached = list_cache_get(cache_key)
+    if cached is not None:
+        upcoming, past = cached
+    else:
+        try:
+            conn = get_connection()
+            cursor = conn.cursor()
 
-        for item in past:
-            item["is_missed"] = bool(item.get("interview_completed") == 0 and item.get("interview_date") and item["interview_date"] < today)
-    except mysql.connector.Error as e:
-        error_message = f"Database error: {e}"
-    finally:
-        if cursor is not None:
-            cursor.close()
-        if conn is not None:
-            conn.close()
+            # is_today / is_soon / is_missed come back from the server as 0/1 columns;
+            # calendar links are built by calendar_redirect only when clicked
+            cursor.execute(
+                venue_sql(INTERVIEWS_SQL, conn),
+                (SOON_WINDOW.days, session["user_id"], session["user_id"]),
+            )
+            for item in rows_as_namedtuples(cursor):
+                (upcoming if item.is_upcoming else past).append(item)
+            # Most recent past interviews first
+            past.reverse()
+            list_cache_put(cache_key, (upcoming, past))
+        except mysql.connector.Error as e:
+            error_message = f"Database error: {e}"
+        finally:
+            if cursor is not None:
+                cursor.close()
+            if conn is not None:
+                conn.close()
 
     # Check for calendar URL in session (from redirect after saving interview)
     calendar_url = session.pop("_interview_calendar_url", None)
@@ -1650,6 +1946,30 @@ def interviews():
     )
 
 
+@app.route("/interviews/<int:job_id>/calendar", methods=["GET"])
+@login_required
+def calendar_redirect(job_id: int):
+    """Build the Google Calendar link for an interview when it is clicked."""
+    # CRITICAL: Ownership validation - fetch_job already filters by user_id
+    job = fetch_job(job_id)
+    if not job or not job.get("interview_date") or not job.get("interview_time"):
+        flash("Interview not found or you don't have permission to access it.", "danger")
+        return redirect(url_for("interviews"))
+
+    try:
+        start_datetime = datetime.combine(job["interview_date"], time.fromisoformat(job["interview_time"]))
+    except ValueError:
+        flash("Could not read the interview time for this calendar event.", "danger")
+        return redirect(url_for("interviews"))
+
+    return redirect(generate_google_calendar_url(
+        title=_CAL_TITLE.format(company=job["company"], role=job["role"]),
+        start_datetime=start_datetime,
+        description=_CAL_DESCRIPTION.format(company=job["company"], role=job["role"]),
+        location=job.get("interview_venue") or "Online",
+    ))
+
+
 # ============================================================================
 # Profile routes
 # ============================================================================
@@ -2161,10 +2481,7 @@ def edit_profile():
     try:
         conn = get_connection()
         cursor = conn.cursor()
-        
-        # Check if profile exists
-        cursor.execute("SELECT id FROM profiles WHERE user_id = %s", (user_id,))
-        exists = cursor.fetchone()
+
 
         # Build JSON structures from form data
         # Identity
@@ -2249,38 +2566,31 @@ def edit_profile():
         looking_for = ", ".join(career_intent.get("target_roles", [])) or (request.form.get("looking_for") or "").strip() or None
         skills_legacy = ", ".join(skills.get("technical", []) + skills.get("tools", [])) or (request.form.get("skills") or "").strip() or None
 
-        if exists:
-            # Update existing profile - MANUAL EDITS ALWAYS TAKE PRIORITY
-            # This completely replaces profile data with user's manual input
-            # CV extraction will respect these manual edits and not overwrite them
-            cursor.execute(
-                """
-                UPDATE profiles
-                SET identity=%s, career_intent=%s, professional_summary=%s,
-                    skills_json=%s, experience_json=%s, education_json=%s, projects_json=%s, achievements_json=%s,
-                    name=%s, email=%s, phone=%s, bio=%s, looking_for=%s, skills=%s,
-                    updated_at=NOW()
-                WHERE user_id=%s
-                """,
-                (identity_json, career_intent_json, professional_summary, skills_json, experience_json, 
-                 education_json, projects_json, achievements_json, name, email, phone, bio, looking_for, 
-                 skills_legacy, user_id),
-            )
-        else:
-            # Insert new profile
-            cursor.execute(
-                """
-                INSERT INTO profiles (
-                    user_id, identity, career_intent, professional_summary,
-                    skills_json, experience_json, education_json, projects_json, achievements_json,
-                    name, email, phone, bio, looking_for, skills
-                )
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
-                (user_id, identity_json, career_intent_json, professional_summary, skills_json, 
-                 experience_json, education_json, projects_json, achievements_json, name, email, phone, 
-                 bio, looking_for, skills_legacy),
+        # Insert or update in one statement (profiles.user_id is UNIQUE).
+        # On update MANUAL EDITS ALWAYS TAKE PRIORITY: this completely replaces profile
+        # data with user's manual input, and CV extraction will not overwrite it
+        cursor.execute(
+            """
+            INSERT INTO profiles (
+                user_id, identity, career_intent, professional_summary,
+                skills_json, experience_json, education_json, projects_json, achievements_json,
+                name, email, phone, bio, looking_for, skills
             )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                identity=VALUES(identity), career_intent=VALUES(career_intent),
+                professional_summary=VALUES(professional_summary),
+                skills_json=VALUES(skills_json), experience_json=VALUES(experience_json),
+                education_json=VALUES(education_json), projects_json=VALUES(projects_json),
+                achievements_json=VALUES(achievements_json),
+                name=VALUES(name), email=VALUES(email), phone=VALUES(phone), bio=VALUES(bio),
+                looking_for=VALUES(looking_for), skills=VALUES(skills),
+                updated_at=NOW()
+            """,
+            (user_id, identity_json, career_intent_json, professional_summary, skills_json, 
+             experience_json, education_json, projects_json, achievements_json, name, email, phone, 
+             bio, looking_for, skills_legacy),
+        )
 
         conn.commit()
         flash("Profile saved successfully.", "success")
@@ -3132,6 +3442,16 @@ def extract_cv_text_route():
         return jsonify({"error": f"Error extracting CV data: {str(e)}"}), 500
 
 
+@app.route("/debug/ai-trace", methods=["GET"])
+@login_required
+def ai_trace():
+    """Recent AI call trace records (debug mode only)."""
+    if not app.debug:
+        return jsonify({"error": "Not available."}), 404
+    limit = request.args.get("limit", 100, type=int)
+    return jsonify({"records": get_ai_trace(limit)})
+
+
 # ============================================================================
 # Common browser request handlers (to prevent 404 logs)
 # ============================================================================
@@ -3214,6 +3534,7 @@ if __name__ == "__main__":
     # Try to create the table at startup so the app works out-of-the-box.
     try:
         ensure_schema()
+        _schema_ready = True
     except mysql.connector.Error as e:
         print(f"[WARN] Could not ensure schema: {e}")
         print("       Make sure MySQL is running and your DB credentials are correct.")
@@ -24,6 +24,10 @@ CREATE TABLE IF NOT EXISTS jobs (
   interview_completed TINYINT(1) NOT NULL DEFAULT 0,
   interview_difficulty VARCHAR(50) NULL,
   interview_experience_notes TEXT NULL,
+  INDEX ix_jobs_status_applied (status, applied_date),
+  INDEX ix_jobs_company (company),
+  INDEX ix_jobs_user_applied (user_id, applied_date),
+  INDEX ix_jobs_user_status (user_id, status, applied_date),
   CONSTRAINT fk_jobs_user FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
 );
 
@@ -44,6 +48,8 @@ CREATE TABLE IF NOT EXISTS interviews (
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   UNIQUE KEY uq_interviews_job (job_id),
+  INDEX ix_interviews_job_date (job_id, interview_date, interview_completed),
+  INDEX ix_interviews_user_date (user_id, interview_date, interview_time),
   CONSTRAINT fk_interviews_job FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
   CONSTRAINT fk_interviews_user FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
 );